@@ -20,10 +20,12 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import atexit
 import hashlib
 import json
 import logging
 import os
+import queue
 import re
 import shlex
 import shutil
@@ -32,13 +34,16 @@ import subprocess
 import sys
 import tempfile
 import textwrap
+import threading
 import time
-from collections import deque
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 
 # ---------------------------------------------------------------------------
@@ -56,6 +61,18 @@ STUCK_THRESHOLD = 3           # same sprint name N times in sequence -> halt
 PM_ERROR_MAX_RETRIES = 1
 SIGNAL_PARSE_MAX_RETRIES = 1
 PARALLEL_LAUNCH_DELAY = 2.0   # seconds between parallel PL launches
+DEFAULT_MAX_PARALLEL = 3      # ready graph nodes executed concurrently
+AGENT_OUTPUT_TAIL_BYTES = 1024 * 1024  # stdout kept in memory for signal parsing
+AGENT_STDERR_TAIL_BYTES = 64 * 1024
+AGENT_STREAM_CHUNK_BYTES = 64 * 1024
+SUBMODULE_INIT_TIMEOUT = 30   # seconds per submodule init in a new worktree
+AGENT_LOG_QUEUE_SIZE = 256    # pending agent-log writes before producers block
+CHECKPOINT_WRITE_DELAY = 0.5  # seconds to coalesce checkpoint updates before writing
+FORCED_SHUTDOWN_FLUSH_TIMEOUT = 5.0  # seconds to flush checkpoints on a second Ctrl+C
+# "always": fsync every checkpoint write. "deferred": background writes skip
+# fsync; flush() at wave barriers and shutdown makes the file durable.
+CHECKPOINT_FSYNC_MODES = ("always", "deferred")
+DEFAULT_CHECKPOINT_FSYNC = "always"
 PROJECT_SLUG_MAX_LENGTH = 64
 PROJECT_SLUG_PATTERN = re.compile(r"^[a-z0-9]+(?:-[a-z0-9]+)*$")
 
@@ -69,6 +86,17 @@ logger = logging.getLogger("orchestrator")
 # Module-level state for agent I/O logging
 _agent_log_dir: Optional[Path] = None
 _invocation_counter = 0
+_agent_log_lock = threading.Lock()
+
+# Agent-log file writes are handed to one background writer thread so node
+# workers never block on disk I/O. Items are (path, data, mode) where mode is
+# "write" (truncate and close), "open" (truncate and keep the handle open for
+# streaming), "append" (write to the open handle) or "close" (append, then
+# close the handle).
+_agent_log_queue: "queue.Queue[Tuple[Path, bytes, str]]" = queue.Queue(
+    maxsize=AGENT_LOG_QUEUE_SIZE
+)
+_agent_log_writer: Optional[threading.Thread] = None
 
 
 def setup_logging(log_dir: Path, log_level: str = DEFAULT_LOG_LEVEL) -> None:
@@ -95,9 +123,187 @@ def setup_logging(log_dir: Path, log_level: str = DEFAULT_LOG_LEVEL) -> None:
     global _agent_log_dir
     _agent_log_dir = log_dir / "agent-logs"
     _agent_log_dir.mkdir(parents=True, exist_ok=True)
+    _start_agent_log_writer()
     logger.info("Agent I/O logs: %s", _agent_log_dir)
 
 
+def _start_agent_log_writer() -> None:
+    """Start the background agent-log writer thread if not already running."""
+    global _agent_log_writer
+    with _agent_log_lock:
+        if _agent_log_writer is not None and _agent_log_writer.is_alive():
+            return
+        _agent_log_writer = threading.Thread(
+            target=_agent_log_writer_loop,
+            name="agent-log-writer",
+            daemon=True,
+        )
+        _agent_log_writer.start()
+
+
+def _agent_log_writer_loop() -> None:
+    """Apply queued agent-log writes in order on a single thread.
+
+    Streamed logs keep one handle open from their "open" item to their
+    "close" item. Any failure is logged and the item dropped: if this thread
+    died, the bounded queue would fill and block every producer.
+    """
+    handles: Dict[Path, Any] = {}
+    while True:
+        path, data, mode = _agent_log_queue.get()
+        try:
+            handle = handles.pop(path, None)
+            if handle is not None and mode in ("write", "open"):
+                handle.close()
+                handle = None
+            if handle is None:
+                handle = path.open("ab" if mode in ("append", "close") else "wb")
+            try:
+                handle.write(data)
+            finally:
+                if mode in ("write", "close"):
+                    handle.close()
+                else:
+                    handles[path] = handle
+        except Exception as exc:
+            handle = handles.pop(path, None)
+            if handle is not None:
+                try:
+                    handle.close()
+                except Exception:
+                    pass
+            logger.warning("Failed to write agent log '%s': %s", path, exc)
+        finally:
+            _agent_log_queue.task_done()
+        if handles and _agent_log_queue.empty():
+            # Idle: push streamed output to disk so the logs can be tailed.
+            for path, handle in list(handles.items()):
+                try:
+                    handle.flush()
+                except Exception as exc:
+                    handles.pop(path).close()
+                    logger.warning("Failed to write agent log '%s': %s", path, exc)
+
+
+def _queue_agent_log_write(path: Path, data: Any, mode: str = "write") -> None:
+    """Queue a write to an agent-log file (str is encoded as UTF-8)."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    if _agent_log_writer is None:
+        # Writer not started (logging not configured); write inline.
+        try:
+            with path.open("ab" if mode in ("append", "close") else "wb") as handle:
+                handle.write(data)
+        except OSError as exc:
+            logger.warning("Failed to write agent log '%s': %s", path, exc)
+        return
+    _agent_log_queue.put((path, bytes(data), mode))
+
+
+def flush_agent_logs() -> None:
+    """Block until every queued agent-log write has been applied."""
+    if _agent_log_writer is not None:
+        _agent_log_queue.join()
+
+
+# Project input files (OUTCOMES.md, ROADMAP.md, CONTEXT.md, ...) are re-read
+# every cycle but rarely change. Cache their text keyed by path and invalidate
+# on (st_mtime_ns, st_size, st_ino) so in-place saves and atomic replaces are
+# seen.
+_file_cache: Dict[Path, Tuple[Tuple[int, int, int], str]] = {}
+_file_cache_lock = threading.Lock()
+
+
+def _read_cached(path: Path) -> str:
+    """Return a UTF-8 file's text, reusing the cached copy if unchanged on disk."""
+    st = os.stat(path)
+    signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+    with _file_cache_lock:
+        cached = _file_cache.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+    text = path.read_text(encoding="utf-8")
+    with _file_cache_lock:
+        _file_cache[path] = (signature, text)
+    return text
+
+
+def _reserve_agent_log(agent_name: str, cycle: int) -> Optional[Tuple[int, str, str]]:
+    """Allocate the (sequence, timestamp, file prefix) for one agent invocation."""
+    if _agent_log_dir is None:
+        return None
+
+    global _invocation_counter
+    with _agent_log_lock:
+        _invocation_counter += 1
+        seq = _invocation_counter
+
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return seq, ts, f"{seq:03d}-{ts}-cycle{cycle:02d}-{agent_name}"
+
+
+def _open_agent_output_log(
+    invocation: Optional[Tuple[int, str, str]],
+    agent_name: str,
+    cycle: int,
+) -> Optional[Path]:
+    """Start the streamed output log for an invocation by writing its header."""
+    if _agent_log_dir is None or invocation is None:
+        return None
+
+    seq, ts, prefix = invocation
+    out_path = _agent_log_dir / f"{prefix}-output.md"
+    _queue_agent_log_write(
+        out_path,
+        f"# Agent: {agent_name} | Cycle: {cycle} | Invocation: {seq}\n"
+        f"# Timestamp: {ts}\n\n",
+        mode="open",
+    )
+    return out_path
+
+
+def _close_agent_output_log(
+    out_path: Optional[Path],
+    elapsed: Optional[float] = None,
+    exit_code: Optional[int] = None,
+) -> None:
+    """Append duration/exit-code trailer lines to a streamed output log."""
+    if out_path is None:
+        return
+
+    trailer = ["", ""]
+    if elapsed is not None:
+        trailer.append(f"# Duration: {elapsed:.1f}s")
+    if exit_code is not None:
+        trailer.append(f"# Exit code: {exit_code}")
+    _queue_agent_log_write(out_path, "\n".join(trailer) + "\n", mode="close")
+
+
+def _pump_agent_stream(
+    stream: Any,
+    sink: Optional[Path],
+    tail: bytearray,
+    tail_limit: int,
+) -> None:
+    """Copy a subprocess pipe into the sink log while retaining a bounded tail."""
+    try:
+        for chunk in iter(lambda: stream.read1(AGENT_STREAM_CHUNK_BYTES), b""):
+            if sink is not None:
+                _queue_agent_log_write(sink, chunk, mode="append")
+            tail += chunk
+            if len(tail) > 2 * tail_limit:
+                del tail[:-tail_limit]
+    finally:
+        stream.close()
+
+
+def _decode_agent_stream(data: bytes, limit: int) -> str:
+    """Decode the tail of captured agent bytes the way text-mode pipes would."""
+    text = data[-limit:].decode("utf-8", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
 def _log_agent_io(
     agent_name: str,
     cycle: int,
@@ -108,31 +314,32 @@ def _log_agent_io(
     exit_code: Optional[int] = None,
     error: Optional[str] = None,
     command: Optional[str] = None,
+    invocation: Optional[Tuple[int, str, str]] = None,
 ) -> None:
     """Write full agent context and output to timestamped files.
 
     Creates per-invocation files in tasks/agent-logs/ for retrospective
-    analysis of every prompt sent and response received.
+    analysis of every prompt sent and response received. Pass the
+    `invocation` reserved before streaming output so all files share one prefix.
     """
     if _agent_log_dir is None:
         return
 
-    global _invocation_counter
-    _invocation_counter += 1
-    seq = _invocation_counter
-
-    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    prefix = f"{seq:03d}-{ts}-cycle{cycle:02d}-{agent_name}"
+    if invocation is None:
+        invocation = _reserve_agent_log(agent_name, cycle)
+        if invocation is None:
+            return
+    seq, ts, prefix = invocation
 
     # Write the context (prompt) sent to the agent
     ctx_path = _agent_log_dir / f"{prefix}-context.md"
     command_line = command or f"claude --print --agent {agent_name} -p <context>"
-    ctx_path.write_text(
+    _queue_agent_log_write(
+        ctx_path,
         f"# Agent: {agent_name} | Cycle: {cycle} | Invocation: {seq}\n"
         f"# Timestamp: {ts}\n"
         f"# Command: {command_line}\n\n"
         f"{context}\n",
-        encoding="utf-8",
     )
 
     # Write the full output (response) from the agent
@@ -148,24 +355,24 @@ def _log_agent_io(
             meta_lines.append(f"# Exit code: {exit_code}")
         meta_lines.append("")
 
-        out_path.write_text(
+        _queue_agent_log_write(
+            out_path,
             "\n".join(meta_lines) + "\n" + output + "\n",
-            encoding="utf-8",
         )
 
     # Write stderr if non-empty
     if stderr and stderr.strip():
         err_path = _agent_log_dir / f"{prefix}-stderr.txt"
-        err_path.write_text(stderr, encoding="utf-8")
+        _queue_agent_log_write(err_path, stderr)
 
     # Write error info if invocation failed
     if error:
         err_path = _agent_log_dir / f"{prefix}-error.txt"
-        err_path.write_text(
+        _queue_agent_log_write(
+            err_path,
             f"# Agent: {agent_name} | Cycle: {cycle} | Invocation: {seq}\n"
             f"# Timestamp: {ts}\n\n"
             f"{error}\n",
-            encoding="utf-8",
         )
 
 
@@ -192,7 +399,10 @@ def _capture_session_logs(
         if src.is_file():
             dest = _agent_log_dir / f"cycle{cycle:02d}-{sprint_name}-{log_name}"
             try:
-                dest.write_bytes(src.read_bytes())
+                # copyfile uses the kernel's copy_file_range/sendfile fast
+                # path. Hardlinks are avoided on purpose: the PL appends to
+                # these logs on later runs, which would rewrite the snapshot.
+                shutil.copyfile(src, dest)
                 logger.info("Captured %s -> %s", src, dest)
             except OSError as exc:
                 logger.warning("Failed to capture %s: %s", src, exc)
@@ -235,6 +445,8 @@ class OrchestratorState:
     max_cycles: int = DEFAULT_MAX_CYCLES
     pm_timeout: int = DEFAULT_PM_TIMEOUT
     pl_timeout: int = DEFAULT_PL_TIMEOUT
+    max_parallel: int = DEFAULT_MAX_PARALLEL
+    checkpoint_fsync: str = DEFAULT_CHECKPOINT_FSYNC
     values_loaded: bool = False
     current_graph: Optional["Graph"] = None
     checkpoint_manager: Optional["CheckpointManager"] = None
@@ -265,6 +477,19 @@ class NodeStatus(Enum):
     RETRYING = "retrying"
 
 
+# Canonical (interned) status strings. _normalize_node_status returns these
+# objects, so status comparisons on the readiness hot path short-circuit on
+# identity, and already-canonical strings skip the strip/lower round-trip.
+_CANONICAL_NODE_STATUSES: Dict[str, str] = {
+    status.value: sys.intern(status.value) for status in NodeStatus
+}
+_TERMINAL_NODE_STATUSES = frozenset((
+    NodeStatus.COMPLETED.value,
+    NodeStatus.FAILED.value,
+    NodeStatus.SKIPPED.value,
+))
+
+
 class ContextFidelityMode(Enum):
     """How much upstream context to pass to a node."""
     MINIMAL = "minimal"
@@ -344,7 +569,7 @@ ALLOWED_OUTCOME_FIELDS = frozenset({
 })
 
 
-@dataclass
+@dataclass(frozen=True)
 class ModelConfig:
     """Model provider configuration for a graph node class."""
     provider: str
@@ -352,10 +577,10 @@ class ModelConfig:
     reasoning_effort: str = "medium"
     tool_profile: str = "claude"
     timeout: int = 7200
-    fallback: List["ModelConfig"] = field(default_factory=list)
+    fallback: Tuple["ModelConfig", ...] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckpointState:
     """Persisted state for an in-flight graph run."""
     run_id: str
@@ -366,7 +591,7 @@ class CheckpointState:
     gate_retries: Dict[str, int] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeCheckpoint:
     """Persisted state for a single node."""
     status: str
@@ -382,17 +607,54 @@ class NodeCheckpoint:
 # Graceful shutdown
 # ---------------------------------------------------------------------------
 
-_shutting_down = False
+# Set once on the first SIGINT; polled by the main loop and between node
+# launches in _dispatch_ready_nodes. Running nodes are left to finish.
+_shutdown_event = threading.Event()
+
+# Live agent subprocesses and checkpoint managers with a running writer,
+# tracked so a forced shutdown can kill the former and flush the latter.
+_agent_processes: Set[subprocess.Popen] = set()
+_pending_checkpoints: Set["CheckpointManager"] = set()
+_shutdown_tracking_lock = threading.Lock()
+
+
+def _force_shutdown() -> None:
+    """Kill running agents, flush checkpoints, and exit without joining workers.
+
+    sys.exit would still join the node worker threads at interpreter exit,
+    which blocks until every agent finishes.
+    """
+    with _shutdown_tracking_lock:
+        processes = list(_agent_processes)
+        managers = list(_pending_checkpoints)
+    for process in processes:
+        try:
+            process.kill()
+        except OSError:
+            pass
+
+    def flush_all() -> None:
+        for manager in managers:
+            try:
+                manager.flush()
+            except Exception as exc:
+                logger.warning("Failed to flush checkpoint on forced shutdown: %s", exc)
+
+    # Flush off the signal-handling thread: if the interrupted main thread
+    # holds a checkpoint lock, wait a bounded time instead of deadlocking.
+    flusher = threading.Thread(target=flush_all, name="forced-shutdown-flush", daemon=True)
+    flusher.start()
+    flusher.join(FORCED_SHUTDOWN_FLUSH_TIMEOUT)
+    os._exit(1)
 
 
 def _handle_sigint(signum: int, frame: Any) -> None:
     """Handle Ctrl+C gracefully -- log state and exit cleanly."""
-    global _shutting_down
-    if _shutting_down:
+    if _shutdown_event.is_set():
         # Second SIGINT = force quit
         logger.warning("Forced shutdown (second SIGINT)")
-        sys.exit(1)
-    _shutting_down = True
+        _force_shutdown()
+    _shutdown_event.set()
     logger.info("Received SIGINT -- shutting down gracefully after current operation")
 
 
@@ -402,13 +664,16 @@ def check_shutdown(state: Optional[OrchestratorState] = None) -> None:
     If state is provided, logs the current orchestrator state (cycle count,
     sprint progress) before exiting for debugging and resume purposes.
     """
-    if _shutting_down:
+    if _shutdown_event.is_set():
         if state is not None:
             logger.info(
                 "Graceful shutdown: cycle %d/%d, %d sprints tracked",
                 state.cycle_count, state.max_cycles, len(state.sprints),
             )
         logger.info("Graceful shutdown: exiting between operations")
+        if state is not None and state.checkpoint_manager is not None:
+            state.checkpoint_manager.close()
+        flush_agent_logs()
         sys.exit(0)
 
 
@@ -442,34 +707,226 @@ def _compare_scalar_values(actual: Any, operator: str, expected: Any) -> bool:
 # Graph engine
 # ---------------------------------------------------------------------------
 
+EDGE_STATUS_CONDITION_PATTERN = re.compile(r'status\s*==\s*["\'](pass|fail)["\']')
+OUTPUT_CONDITION_PATTERN = re.compile(
+    r'output\.([A-Za-z_][\w]*)\s*(==|!=|>=|<=|>|<)\s*(.+)'
+)
+
+
+@lru_cache(maxsize=256)
+def _parse_edge_condition(condition: str) -> Tuple[Any, ...]:
+    """Parse an edge condition once into a (kind, *args) evaluation plan.
+
+    Conditions come from a small fixed vocabulary and every edge is evaluated
+    on each readiness sweep, so plans are cached by condition text.
+    """
+    if not condition or condition == "always":
+        return ("always",)
+
+    status_match = EDGE_STATUS_CONDITION_PATTERN.fullmatch(condition)
+    if status_match:
+        if status_match.group(1) == "pass":
+            return ("status", NodeStatus.COMPLETED.value)
+        return ("status", NodeStatus.FAILED.value)
+
+    output_match = OUTPUT_CONDITION_PATTERN.fullmatch(condition)
+    if not output_match:
+        return ("unsupported",)
+
+    field_name, operator, raw_value = output_match.groups()
+    if field_name not in ALLOWED_OUTCOME_FIELDS:
+        return ("disallowed", field_name)
+    return ("output", field_name, operator, _parse_scalar(raw_value.strip()))
+
+
+def _evaluate_condition_plan(
+    plan: Tuple[Any, ...],
+    condition: str,
+    source_id: str,
+    target_id: str,
+    source_outcome: Optional[NodeOutcome],
+) -> bool:
+    """Evaluate a parsed edge condition plan against a source node outcome."""
+    kind = plan[0]
+
+    if kind == "always":
+        return True
+
+    if source_outcome is None:
+        logger.warning(
+            "Edge %s -> %s condition '%s' cannot be evaluated without source outcome",
+            source_id, target_id, condition,
+        )
+        return False
+
+    if kind == "status":
+        return _normalize_node_status(source_outcome.status) == plan[1]
+
+    if kind == "unsupported":
+        logger.warning(
+            "Unsupported edge condition '%s' for edge %s -> %s",
+            condition, source_id, target_id,
+        )
+        return False
+
+    if kind == "disallowed":
+        logger.warning(
+            "Disallowed edge condition field '%s' for edge %s -> %s",
+            plan[1],
+            source_id,
+            target_id,
+        )
+        return False
+
+    _, field_name, operator, expected_value = plan
+    try:
+        if not hasattr(source_outcome, field_name):
+            logger.warning(
+                "Edge condition references missing NodeOutcome field '%s' for edge %s -> %s",
+                field_name,
+                source_id,
+                target_id,
+            )
+            return False
+        actual_value = getattr(source_outcome, field_name)
+        return _compare_scalar_values(actual_value, operator, expected_value)
+    except Exception as exc:
+        logger.warning(
+            "Failed to evaluate edge condition '%s' for edge %s -> %s: %s",
+            condition, source_id, target_id, exc,
+        )
+        return False
+
+
+# Adjacency and validation results depend only on node IDs and edges, and the
+# same topology is wrapped in a fresh GraphEngine many times per run (context
+# building, checkpointing, traversal). Engines share read-only structures via
+# this cache, keyed by a topology hash.
+_GRAPH_TOPOLOGY_CACHE_MAX = 32
+_graph_topology_cache: Dict[str, Dict[str, Any]] = {}
+_graph_topology_lock = threading.Lock()
+
+
+def _graph_topology_key(graph: Graph) -> str:
+    """Hash the node IDs and edges that determine graph topology."""
+    parts: List[str] = list(graph.nodes)
+    parts.append("\x01")
+    for edge in graph.edges:
+        parts.append(str(edge.source))
+        parts.append(str(edge.target))
+        parts.append(str(edge.condition))
+    return hashlib.blake2b(
+        "\x00".join(parts).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+
+
+def _build_graph_topology(graph: Graph) -> Dict[str, Any]:
+    """Build adjacency, in-degree and flat edge arrays for a graph.
+
+    Readiness sweeps walk edges by integer index over parallel arrays of
+    interned source/target IDs and pre-parsed condition plans rather than
+    dereferencing GraphEdge objects and reparsing conditions per edge.
+    """
+    forward_edges: Dict[str, List[GraphEdge]] = {
+        node_id: [] for node_id in graph.nodes
+    }
+    reverse_edges: Dict[str, List[GraphEdge]] = {
+        node_id: [] for node_id in graph.nodes
+    }
+    in_degree: Dict[str, int] = {
+        node_id: 0 for node_id in graph.nodes
+    }
+
+    edge_source: List[str] = []
+    edge_target: List[str] = []
+    edge_condition: List[str] = []
+    edge_plan: List[Tuple[Any, ...]] = []
+    forward_index: Dict[str, List[int]] = {node_id: [] for node_id in graph.nodes}
+    reverse_index: Dict[str, List[int]] = {node_id: [] for node_id in graph.nodes}
+
+    for index, edge in enumerate(graph.edges):
+        forward_edges.setdefault(edge.source, []).append(edge)
+        reverse_edges.setdefault(edge.target, []).append(edge)
+        if edge.target in in_degree:
+            in_degree[edge.target] += 1
+
+        source = sys.intern(str(edge.source))
+        target = sys.intern(str(edge.target))
+        condition = (edge.condition or "always").strip()
+        edge_source.append(source)
+        edge_target.append(target)
+        edge_condition.append(condition)
+        edge_plan.append(_parse_edge_condition(condition))
+        forward_index.setdefault(source, []).append(index)
+        reverse_index.setdefault(target, []).append(index)
+
+    return {
+        "forward_edges": forward_edges,
+        "reverse_edges": reverse_edges,
+        "in_degree": in_degree,
+        "edge_source": edge_source,
+        "edge_target": edge_target,
+        "edge_condition": edge_condition,
+        "edge_plan": edge_plan,
+        "forward_index": forward_index,
+        "reverse_index": reverse_index,
+        "validation": None,
+        # node_id -> frozenset of transitive downstream IDs, filled lazily.
+        "downstream_closures": {},
+        # node_id -> tuple of transitive upstream IDs in BFS order, filled lazily.
+        "upstream_paths": {},
+    }
+
+
+def _graph_topology(graph: Graph) -> Dict[str, Any]:
+    """Return cached topology for a graph, building it on first use."""
+    key = _graph_topology_key(graph)
+    with _graph_topology_lock:
+        topology = _graph_topology_cache.get(key)
+        if topology is not None:
+            return topology
+
+    topology = _build_graph_topology(graph)
+    with _graph_topology_lock:
+        if len(_graph_topology_cache) >= _GRAPH_TOPOLOGY_CACHE_MAX:
+            _graph_topology_cache.pop(next(iter(_graph_topology_cache)))
+        return _graph_topology_cache.setdefault(key, topology)
+
+
 class GraphEngine:
     """Core graph utilities for validation and traversal readiness."""
 
     def __init__(self, graph: Graph):
         self.graph = graph
-        self.forward_edges: Dict[str, List[GraphEdge]] = {
-            node_id: [] for node_id in graph.nodes
-        }
-        self.reverse_edges: Dict[str, List[GraphEdge]] = {
-            node_id: [] for node_id in graph.nodes
-        }
-        self.in_degree: Dict[str, int] = {
-            node_id: 0 for node_id in graph.nodes
-        }
-
-        for edge in graph.edges:
-            self.forward_edges.setdefault(edge.source, []).append(edge)
-            self.reverse_edges.setdefault(edge.target, []).append(edge)
-            if edge.target in self.in_degree:
-                self.in_degree[edge.target] += 1
-
-        # Ensure all graph nodes are addressable even when no edges exist.
-        for node_id in graph.nodes:
-            self.forward_edges.setdefault(node_id, [])
-            self.reverse_edges.setdefault(node_id, [])
+        # Shared across engines for the same topology; treat as read-only.
+        self._topology = _graph_topology(graph)
+        self.forward_edges: Dict[str, List[GraphEdge]] = self._topology["forward_edges"]
+        self.reverse_edges: Dict[str, List[GraphEdge]] = self._topology["reverse_edges"]
+        self.in_degree: Dict[str, int] = self._topology["in_degree"]
+        self._edge_source: List[str] = self._topology["edge_source"]
+        self._edge_target: List[str] = self._topology["edge_target"]
+        self._edge_condition: List[str] = self._topology["edge_condition"]
+        self._edge_plan: List[Tuple[Any, ...]] = self._topology["edge_plan"]
+        self._forward_index: Dict[str, List[int]] = self._topology["forward_index"]
+        self._reverse_index: Dict[str, List[int]] = self._topology["reverse_index"]
+        self._downstream_closures: Dict[str, frozenset] = self._topology["downstream_closures"]
+        self._upstream_paths: Dict[str, Tuple[str, ...]] = self._topology["upstream_paths"]
+        # Incremental ready frontier (see seed_ready_frontier).
+        self._remaining_deps: Dict[str, int] = {}
+        self._ready_queue: deque[str] = deque()
 
     def validate(self) -> Tuple[bool, List[str]]:
         """Validate node references and DAG acyclicity."""
+        cached = self._topology["validation"]
+        if cached is None:
+            cached = self._validate_uncached()
+            self._topology["validation"] = cached
+        valid, errors = cached
+        return (valid, list(errors))
+
+    def _validate_uncached(self) -> Tuple[bool, List[str]]:
+        """Run reference checks and Kahn's algorithm over the graph."""
         errors: List[str] = []
         seen_missing: Set[str] = set()
 
@@ -533,160 +990,245 @@ class GraphEngine:
             if node_id in status_map and current_status != NodeStatus.PENDING.value:
                 continue
 
-            incoming = self.reverse_edges.get(node_id, [])
-            if not incoming:
+            if all(
+                self._edge_index_satisfied(index, status_map, outcome_map)
+                for index in self._reverse_index.get(node_id, ())
+            ):
                 ready.append(node_id)
+
+        return ready
+
+    def seed_ready_frontier(
+        self,
+        status_map: Dict[str, str],
+        outcome_map: Optional[Dict[str, NodeOutcome]] = None,
+    ) -> None:
+        """Rebuild the incremental ready queue from a full status snapshot.
+
+        Call before traversal and again whenever node states are reset out of
+        band (gate retries). In between, on_node_completed() keeps the
+        frontier current without rescanning every node and edge.
+        """
+        self._remaining_deps = {}
+        self._ready_queue = deque()
+
+        for node_id in self.graph.nodes:
+            current_status = _normalize_node_status(
+                status_map.get(node_id, NodeStatus.PENDING.value)
+            )
+            if current_status != NodeStatus.PENDING.value:
                 continue
 
-            is_ready = True
-            for edge in incoming:
-                source_status = _normalize_node_status(
-                    status_map.get(edge.source, "")
-                )
-                if source_status not in (
-                    NodeStatus.COMPLETED.value,
-                    NodeStatus.FAILED.value,
-                    NodeStatus.SKIPPED.value,
-                ):
-                    is_ready = False
-                    break
+            remaining = sum(
+                1
+                for index in self._reverse_index.get(node_id, ())
+                if not self._edge_index_satisfied(index, status_map, outcome_map)
+            )
+            self._remaining_deps[node_id] = remaining
+            if remaining == 0:
+                self._ready_queue.append(node_id)
 
-                source_outcome = (
-                    outcome_map.get(edge.source)
-                    if outcome_map is not None
-                    else None
-                )
-                if source_outcome is None:
-                    source_outcome = NodeOutcome(
-                        status=source_status,
-                        output_summary="",
-                    )
-                if not self.evaluate_edge_condition(edge, source_outcome):
-                    is_ready = False
-                    break
+    def on_node_completed(self, node_id: str, outcome: NodeOutcome) -> None:
+        """Release downstream nodes whose last outstanding dependency finished."""
+        if not _is_terminal_node_status(outcome.status):
+            return
 
-            if is_ready:
-                ready.append(node_id)
+        for index in self._forward_index.get(node_id, ()):
+            target_id = self._edge_target[index]
+            remaining = self._remaining_deps.get(target_id, 0)
+            if remaining <= 0:
+                continue
+            if not self._evaluate_edge_index(index, outcome):
+                continue
+            remaining -= 1
+            self._remaining_deps[target_id] = remaining
+            if remaining == 0:
+                self._ready_queue.append(target_id)
 
+    def drain_ready_nodes(self, status_map: Dict[str, str]) -> List[str]:
+        """Pop queued ready nodes that are still pending in status_map."""
+        ready: List[str] = []
+        seen: Set[str] = set()
+        while self._ready_queue:
+            node_id = self._ready_queue.popleft()
+            if node_id in seen:
+                continue
+            seen.add(node_id)
+            current_status = _normalize_node_status(
+                status_map.get(node_id, NodeStatus.PENDING.value)
+            )
+            if current_status == NodeStatus.PENDING.value:
+                ready.append(node_id)
         return ready
 
-    def evaluate_edge_condition(
+    def _edge_index_satisfied(
         self,
-        edge: GraphEdge,
-        source_outcome: Optional[NodeOutcome],
+        index: int,
+        status_map: Dict[str, str],
+        outcome_map: Optional[Dict[str, NodeOutcome]],
     ) -> bool:
-        """Evaluate edge activation condition against source node output."""
-        condition = (edge.condition or "always").strip()
-
-        if not condition or condition == "always":
-            return True
+        """Return True when edge source is finished and its condition holds."""
+        source_id = self._edge_source[index]
+        source_status = _normalize_node_status(status_map.get(source_id, ""))
+        if source_status not in _TERMINAL_NODE_STATUSES:
+            return False
 
+        source_outcome = (
+            outcome_map.get(source_id)
+            if outcome_map is not None
+            else None
+        )
         if source_outcome is None:
-            logger.warning(
-                "Edge %s -> %s condition '%s' cannot be evaluated without source outcome",
-                edge.source, edge.target, condition,
+            source_outcome = NodeOutcome(
+                status=source_status,
+                output_summary="",
             )
-            return False
+        return self._evaluate_edge_index(index, source_outcome)
 
-        status_match = re.fullmatch(
-            r'status\s*==\s*["\'](pass|fail)["\']',
-            condition,
+    def _evaluate_edge_index(
+        self,
+        index: int,
+        source_outcome: Optional[NodeOutcome],
+    ) -> bool:
+        """Evaluate the pre-parsed condition plan of the edge at index."""
+        if self._edge_plan[index][0] == "always":
+            return True
+        return _evaluate_condition_plan(
+            self._edge_plan[index],
+            self._edge_condition[index],
+            self._edge_source[index],
+            self._edge_target[index],
+            source_outcome,
         )
-        if status_match:
-            status_check = status_match.group(1)
-            actual_status = _normalize_node_status(source_outcome.status)
-            if status_check == "pass":
-                return actual_status == NodeStatus.COMPLETED.value
-            return actual_status == NodeStatus.FAILED.value
-
-        output_match = re.fullmatch(
-            r'output\.([A-Za-z_][\w]*)\s*(==|!=|>=|<=|>|<)\s*(.+)',
+
+    def evaluate_edge_condition(
+        self,
+        edge: GraphEdge,
+        source_outcome: Optional[NodeOutcome],
+    ) -> bool:
+        """Evaluate edge activation condition against source node output."""
+        condition = (edge.condition or "always").strip()
+        return _evaluate_condition_plan(
+            _parse_edge_condition(condition),
             condition,
+            edge.source,
+            edge.target,
+            source_outcome,
         )
-        if not output_match:
-            logger.warning(
-                "Unsupported edge condition '%s' for edge %s -> %s",
-                condition, edge.source, edge.target,
-            )
-            return False
-
-        field_name, operator, raw_value = output_match.groups()
-        if field_name not in ALLOWED_OUTCOME_FIELDS:
-            logger.warning(
-                "Disallowed edge condition field '%s' for edge %s -> %s",
-                field_name,
-                edge.source,
-                edge.target,
-            )
-            return False
-        try:
-            if not hasattr(source_outcome, field_name):
-                logger.warning(
-                    "Edge condition references missing NodeOutcome field '%s' for edge %s -> %s",
-                    field_name,
-                    edge.source,
-                    edge.target,
-                )
-                return False
-            actual_value = getattr(source_outcome, field_name)
-            expected_value = _parse_scalar(raw_value.strip())
-            return _compare_scalar_values(actual_value, operator, expected_value)
-        except Exception as exc:
-            logger.warning(
-                "Failed to evaluate edge condition '%s' for edge %s -> %s: %s",
-                condition, edge.source, edge.target, exc,
-            )
-            return False
 
     def get_downstream_nodes(self, node_id: str) -> List[str]:
         """Return all direct downstream node IDs from node_id."""
         return [edge.target for edge in self.forward_edges.get(node_id, [])]
 
+    def get_downstream_closure(self, node_id: str) -> frozenset:
+        """Return every node transitively downstream of node_id (memoized).
+
+        The start node is only included when it sits on a cycle.
+        """
+        cached = self._downstream_closures.get(node_id)
+        if cached is not None:
+            return cached
+
+        # Depth-first with mark-on-push: the stack never holds a node twice
+        # and is bounded by graph depth rather than frontier width.
+        edge_target = self._edge_target
+        forward_index = self._forward_index
+        stack: List[str] = [node_id]
+        seen: Set[str] = set()
+        while stack:
+            for index in forward_index.get(stack.pop(), ()):
+                downstream_id = edge_target[index]
+                if downstream_id not in seen:
+                    seen.add(downstream_id)
+                    stack.append(downstream_id)
+
+        closure = frozenset(seen)
+        self._downstream_closures[node_id] = closure
+        return closure
+
     def get_upstream_nodes(self, node_id: str) -> List[str]:
         """Return all direct upstream node IDs into node_id."""
         return [edge.source for edge in self.reverse_edges.get(node_id, [])]
 
+    def get_upstream_path(self, node_id: str) -> Tuple[str, ...]:
+        """Return every node transitively upstream of node_id (memoized).
+
+        Breadth-first from node_id, visiting each node's sources in sorted
+        order, so the nearest upstream nodes come first.
+        """
+        cached = self._upstream_paths.get(node_id)
+        if cached is not None:
+            return cached
+
+        edge_source = self._edge_source
+        reverse_index = self._reverse_index
+        queue: deque[str] = deque(
+            sorted(edge_source[index] for index in reverse_index.get(node_id, ()))
+        )
+        seen: Set[str] = set()
+        ordered: List[str] = []
+        while queue:
+            current = queue.popleft()
+            if current in seen:
+                continue
+            seen.add(current)
+            ordered.append(current)
+            for upstream_id in sorted(
+                edge_source[index] for index in reverse_index.get(current, ())
+            ):
+                if upstream_id not in seen:
+                    queue.append(upstream_id)
+
+        path = tuple(ordered)
+        self._upstream_paths[node_id] = path
+        return path
+
     def _find_cycle(self, candidates: Set[str]) -> List[str]:
-        """Return a concrete cycle path, including repeated start node."""
+        """Return a concrete cycle path, including repeated start node.
+
+        Uses an explicit stack so long dependency chains cannot hit the
+        interpreter recursion limit.
+        """
         visited: Set[str] = set()
-        recursion_stack: Set[str] = set()
+        on_stack: Set[str] = set()
         parent: Dict[str, str] = {}
 
-        def dfs(node_id: str) -> List[str]:
-            visited.add(node_id)
-            recursion_stack.add(node_id)
-
-            for edge in self.forward_edges.get(node_id, []):
-                target_id = edge.target
-                if target_id not in candidates:
-                    continue
+        for start_id in candidates:
+            if start_id in visited:
+                continue
 
-                if target_id not in visited:
-                    parent[target_id] = node_id
-                    cycle = dfs(target_id)
-                    if cycle:
-                        return cycle
-                    continue
+            visited.add(start_id)
+            on_stack.add(start_id)
+            stack = [(start_id, iter(self.forward_edges.get(start_id, [])))]
 
-                if target_id in recursion_stack:
-                    cycle = [target_id]
-                    cursor = node_id
-                    while cursor != target_id:
-                        cycle.append(cursor)
-                        cursor = parent[cursor]
-                    cycle.append(target_id)
-                    cycle.reverse()
-                    return cycle
-
-            recursion_stack.remove(node_id)
-            return []
+            while stack:
+                node_id, edges = stack[-1]
+                for edge in edges:
+                    target_id = edge.target
+                    if target_id not in candidates:
+                        continue
 
-        for node_id in candidates:
-            if node_id in visited:
-                continue
-            cycle = dfs(node_id)
-            if cycle:
-                return cycle
+                    if target_id not in visited:
+                        parent[target_id] = node_id
+                        visited.add(target_id)
+                        on_stack.add(target_id)
+                        stack.append(
+                            (target_id, iter(self.forward_edges.get(target_id, [])))
+                        )
+                        break
+
+                    if target_id in on_stack:
+                        cycle = [target_id]
+                        cursor = node_id
+                        while cursor != target_id:
+                            cycle.append(cursor)
+                            cursor = parent[cursor]
+                        cycle.append(target_id)
+                        cycle.reverse()
+                        return cycle
+                else:
+                    stack.pop()
+                    on_stack.discard(node_id)
 
         return []
 
@@ -815,10 +1357,7 @@ class GoalGate:
                 {"command": command_match.group(1).strip()},
             )
 
-        output_match = re.fullmatch(
-            r"output\.([A-Za-z_][\w]*)\s*(==|!=|>=|<=|>|<)\s*(.+)",
-            criterion_text,
-        )
+        output_match = OUTPUT_CONDITION_PATTERN.fullmatch(criterion_text)
         if output_match:
             field_name, operator, raw_value = output_match.groups()
             return (
@@ -967,6 +1506,11 @@ class GoalGate:
 class NodeHandler:
     """Base interface for domain-specific graph node execution."""
 
+    # True when execute() works in its own checkout, so nodes may run
+    # concurrently. Handlers writing into the shared project checkout must
+    # run alone: a concurrent merge can stash or overwrite their edits.
+    runs_isolated = False
+
     def execute(
         self,
         node: GraphNode,
@@ -978,6 +1522,9 @@ class NodeHandler:
     ) -> NodeOutcome:
         raise NotImplementedError(f"{self.__class__.__name__} must implement execute()")
 
+    def close(self) -> None:
+        """Release resources held across executions (default: none)."""
+
     @staticmethod
     def _signal_to_outcome_status(signal_payload: Dict[str, Any]) -> str:
         """Map signal payloads to checkpoint-friendly node statuses."""
@@ -1035,9 +1582,274 @@ class NodeHandler:
             return str(path)
 
 
+def _fast_rmtree(path: Path) -> None:
+    """Delete a directory tree, best effort.
+
+    On POSIX, 'rm -rf' unlinks in C instead of shutil.rmtree's per-entry
+    Python walk, which matters for full worktree checkouts.
+    """
+    if os.name == "posix":
+        try:
+            result = subprocess.run(
+                ["rm", "-rf", "--", str(path)],
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                check=False,
+            )
+        except OSError:
+            pass
+        else:
+            if result.returncode == 0:
+                return
+    shutil.rmtree(path, ignore_errors=True)
+
+
+class WorktreePool:
+    """Reusable git worktree checkouts under <project>/.worktrees.
+
+    Creating and removing a worktree per node costs a full index checkout
+    each time. Released worktrees are instead cleaned, detached and kept idle
+    (up to pool_size) so the next node only needs a branch checkout.
+
+    Only the main-checkout preflight holds _git_lock; checkouts, adds and
+    removals operate on separate worktree directories and run concurrently
+    (git serializes ref and worktree metadata updates with its own locks).
+    """
+
+    def __init__(
+        self,
+        project_dir: Path,
+        pool_size: int = DEFAULT_MAX_PARALLEL,
+        share_submodule_objects: bool = True,
+    ):
+        self.project_dir = project_dir
+        self.pool_size = max(1, pool_size)
+        self.share_submodule_objects = share_submodule_objects
+        self.worktrees_dir = project_dir / ".worktrees"
+        self._idle: deque[Path] = deque()
+        self._next_index = 0
+        self._lock = threading.Lock()
+        self.worktrees_dir.mkdir(parents=True, exist_ok=True)
+
+    def acquire(self, node_id: str, branch: str) -> Optional[Path]:
+        """Return a worktree with branch checked out, reusing an idle one if possible."""
+        with _git_lock:
+            branch_exists, head_sha, base_sha = _preflight_worktree(self.project_dir, branch)
+            # New branches are created explicitly at main's tip, so the main
+            # checkout only needs switching when HEAD is somewhere else.
+            if base_sha is None or head_sha != base_sha:
+                if not checkout_main(self.project_dir):
+                    logger.error(
+                        "Cannot create worktree for node '%s': failed to checkout main",
+                        node_id,
+                    )
+                    return None
+                if base_sha is None:
+                    branch_exists, _, base_sha = _preflight_worktree(self.project_dir, branch)
+
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                worktree_path = self._idle.popleft()
+            if self._checkout(worktree_path, branch, branch_exists, base_sha):
+                logger.info(
+                    "Reusing worktree for node '%s': %s (branch: %s)",
+                    node_id,
+                    worktree_path,
+                    branch,
+                )
+                return worktree_path
+            self._discard(worktree_path)
+
+        return self._add(node_id, branch, branch_exists, base_sha)
+
+    def release(self, worktree_path: Path) -> None:
+        """Clean a worktree and park it detached for reuse (or remove it)."""
+        if not worktree_path.exists():
+            return
+        with self._lock:
+            pool_full = len(self._idle) >= self.pool_size
+        if pool_full:
+            self._discard(worktree_path)
+            return
+
+        for args in (
+            ["reset", "--hard", "--quiet"],
+            ["clean", "-fdxq"],
+            ["checkout", "--detach", "--quiet"],
+        ):
+            result = git_run(args, worktree_path, check=False)
+            if result.returncode != 0:
+                logger.warning(
+                    "Failed to reset worktree '%s' for reuse: %s",
+                    worktree_path,
+                    (result.stderr or result.stdout or "unknown error").strip(),
+                )
+                self._discard(worktree_path)
+                return
+        with self._lock:
+            self._idle.append(worktree_path)
+
+    def close(self) -> None:
+        """Remove every idle worktree."""
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for worktree_path in idle:
+            self._discard(worktree_path)
+
+    def _checkout(
+        self,
+        worktree_path: Path,
+        branch: str,
+        branch_exists: bool,
+        base_sha: Optional[str],
+    ) -> bool:
+        """Switch an idle worktree onto branch (new branches start at main)."""
+        if branch_exists:
+            cmd = ["checkout", "--quiet", branch]
+        elif base_sha:
+            cmd = ["checkout", "--quiet", "-b", branch, base_sha]
+        else:
+            return False
+        return git_run(cmd, worktree_path, check=False).returncode == 0
+
+    def _add(
+        self,
+        node_id: str,
+        branch: str,
+        branch_exists: bool,
+        base_sha: Optional[str],
+    ) -> Optional[Path]:
+        """Create a new worktree directory with branch checked out."""
+        with self._lock:
+            self._next_index += 1
+            worktree_path = self.worktrees_dir / f"wt-{self._next_index:02d}"
+
+        if worktree_path.exists():
+            git_run(
+                ["worktree", "remove", str(worktree_path), "--force"],
+                self.project_dir,
+                check=False,
+            )
+            if worktree_path.exists():
+                _fast_rmtree(worktree_path)
+                git_run(["worktree", "prune"], self.project_dir, check=False)
+
+        if branch_exists:
+            cmd = ["worktree", "add", str(worktree_path), branch]
+        else:
+            cmd = ["worktree", "add", str(worktree_path), "-b", branch]
+            if base_sha:
+                cmd.append(base_sha)
+        result = git_run(cmd, self.project_dir, check=False)
+
+        if result.returncode != 0:
+            logger.error(
+                "Failed to create worktree for node '%s' (%s): %s",
+                node_id,
+                branch,
+                (result.stderr or result.stdout or "unknown error").strip(),
+            )
+            return None
+
+        logger.info(
+            "Created worktree for node '%s': %s (branch: %s)",
+            node_id,
+            worktree_path,
+            branch,
+        )
+        if self.share_submodule_objects:
+            self._init_submodules(worktree_path)
+        return worktree_path
+
+    def _init_submodules(self, worktree_path: Path) -> None:
+        """Initialize submodules borrowing objects from the main checkout's clones.
+
+        Only submodules already cloned under the main repository's
+        modules/ directory are initialized; '--reference' points the new
+        clone at those objects instead of fetching them again.
+        """
+        if not (worktree_path / ".gitmodules").is_file():
+            return
+        dirs = _git_dirs(self.project_dir)
+        if dirs is None:
+            return
+        modules_dir = dirs[1] / "modules"
+
+        status = git_run(["submodule", "status"], worktree_path, check=False)
+        for line in status.stdout.splitlines():
+            if not line.startswith("-"):
+                continue
+            parts = line[1:].split()
+            if len(parts) < 2:
+                continue
+            submodule_path = parts[1]
+            reference_dir = modules_dir / submodule_path
+            if not reference_dir.is_dir():
+                continue
+            try:
+                result = git_run(
+                    [
+                        "submodule", "update", "--init",
+                        "--reference", str(reference_dir),
+                        "--", submodule_path,
+                    ],
+                    worktree_path,
+                    check=False,
+                    timeout=SUBMODULE_INIT_TIMEOUT,
+                )
+            except subprocess.TimeoutExpired:
+                logger.warning(
+                    "Timed out initializing submodule '%s' in %s",
+                    submodule_path,
+                    worktree_path,
+                )
+                continue
+            if result.returncode != 0:
+                logger.warning(
+                    "Failed to initialize submodule '%s' in %s: %s",
+                    submodule_path,
+                    worktree_path,
+                    (result.stderr or result.stdout or "unknown error").strip(),
+                )
+
+    def _discard(self, worktree_path: Path) -> None:
+        """Remove a worktree, pruning its administrative files if git could not."""
+        result = git_run(
+            ["worktree", "remove", str(worktree_path), "--force"],
+            self.project_dir,
+            check=False,
+        )
+        if result.returncode != 0:
+            logger.warning(
+                "Failed to remove worktree '%s': %s",
+                worktree_path,
+                (result.stderr or result.stdout or "unknown error").strip(),
+            )
+            if worktree_path.exists():
+                _fast_rmtree(worktree_path)
+            # A successful 'worktree remove' already drops the admin entry;
+            # only a failed one leaves something behind to prune.
+            git_run(["worktree", "prune"], self.project_dir, check=False)
+
+
 class SoftwareHandler(NodeHandler):
     """Execute software implementation nodes in isolated git worktrees."""
 
+    runs_isolated = True
+
+    def __init__(
+        self,
+        worktree_pool_size: int = DEFAULT_MAX_PARALLEL,
+        share_submodule_objects: bool = True,
+    ):
+        self.worktree_pool_size = worktree_pool_size
+        self.share_submodule_objects = share_submodule_objects
+        self._worktree_pools: Dict[Path, WorktreePool] = {}
+        self._pools_lock = threading.Lock()
+
     def execute(
         self,
         node: GraphNode,
@@ -1101,7 +1913,7 @@ class SoftwareHandler(NodeHandler):
             if node.inputs:
                 pl_context += (
                     "\n\nNODE_INPUTS:\n"
-                    + json.dumps(node.inputs, indent=2, sort_keys=True, ensure_ascii=True)
+                    + _PROMPT_JSON_ENCODER.encode(node.inputs)
                 )
             if context:
                 pl_context += f"\n\nUPSTREAM_CONTEXT:\n{context}"
@@ -1136,10 +1948,13 @@ class SoftwareHandler(NodeHandler):
         else:
             signal_type = str(signal_payload.get("signal", "unknown")).strip().lower()
             if signal_type == "done":
-                merge_success, merge_details = self._merge_worktree_branch(branch, project_dir)
-                if merge_success:
-                    delete_branch(branch, project_dir)
-                else:
+                with _git_lock:
+                    merge_success, merge_details = self._merge_worktree_branch(
+                        branch, project_dir
+                    )
+                    if merge_success:
+                        delete_branch(branch, project_dir)
+                if not merge_success:
                     signal_payload = dict(signal_payload)
                     signal_payload["signal"] = "error"
                     signal_payload["error_type"] = "merge_failed"
@@ -1149,7 +1964,7 @@ class SoftwareHandler(NodeHandler):
                     signal_payload["merge_conflict"] = merge_details
         finally:
             if worktree_path is not None:
-                self._remove_worktree(node.id, project_dir)
+                self._remove_worktree(worktree_path, project_dir)
 
         summary = self._signal_summary(signal_payload, node.id)
         error_details = self._signal_error(signal_payload, node.id)
@@ -1167,91 +1982,66 @@ class SoftwareHandler(NodeHandler):
             merge_details=merge_details,
         )
 
+    def _worktree_pool(self, project_dir: Path) -> WorktreePool:
+        """Return the worktree pool for project_dir, creating it on first use."""
+        with self._pools_lock:
+            pool = self._worktree_pools.get(project_dir)
+            if pool is None:
+                pool = WorktreePool(
+                    project_dir,
+                    self.worktree_pool_size,
+                    share_submodule_objects=self.share_submodule_objects,
+                )
+                self._worktree_pools[project_dir] = pool
+            return pool
+
     def _create_worktree(
         self,
         node_id: str,
         branch: str,
         project_dir: Path,
     ) -> Optional[Path]:
-        """Create an isolated git worktree for a graph node."""
-        if not checkout_main(project_dir):
-            logger.error(
-                "Cannot create worktree for node '%s': failed to checkout main",
-                node_id,
-            )
-            return None
-
-        safe_node_id = re.sub(r"[^a-zA-Z0-9._-]", "-", node_id).strip("-") or "node"
-        worktrees_dir = project_dir / ".worktrees"
-        worktrees_dir.mkdir(parents=True, exist_ok=True)
-        worktree_path = worktrees_dir / safe_node_id
-
-        if worktree_path.exists():
-            git_run(
-                ["worktree", "remove", str(worktree_path), "--force"],
-                project_dir,
-                check=False,
-            )
-            if worktree_path.exists():
-                shutil.rmtree(worktree_path, ignore_errors=True)
-
-        branch_exists = git_run(
-            ["rev-parse", "--verify", branch],
-            project_dir,
-            check=False,
-        ).returncode == 0
-
-        if branch_exists:
-            cmd = ["worktree", "add", str(worktree_path), branch]
-        else:
-            cmd = ["worktree", "add", str(worktree_path), "-b", branch]
-        result = git_run(cmd, project_dir, check=False)
-
-        if result.returncode != 0:
-            logger.error(
-                "Failed to create worktree for node '%s' (%s): %s",
-                node_id,
-                branch,
-                (result.stderr or result.stdout or "unknown error").strip(),
-            )
-            return None
+        """Check out an isolated git worktree for a graph node."""
+        return self._worktree_pool(project_dir).acquire(node_id, branch)
 
-        logger.info(
-            "Created worktree for node '%s': %s (branch: %s)",
-            node_id,
-            worktree_path,
-            branch,
-        )
-        return worktree_path
+    def _remove_worktree(self, worktree_path: Path, project_dir: Path) -> None:
+        """Return a node worktree to the pool after execution."""
+        self._worktree_pool(project_dir).release(worktree_path)
 
-    def _remove_worktree(self, node_id: str, project_dir: Path) -> None:
-        """Remove node worktree after execution to avoid orphaned checkouts."""
-        safe_node_id = re.sub(r"[^a-zA-Z0-9._-]", "-", node_id).strip("-") or "node"
-        worktree_path = project_dir / ".worktrees" / safe_node_id
-        if not worktree_path.exists():
-            return
-
-        result = git_run(
-            ["worktree", "remove", str(worktree_path), "--force"],
-            project_dir,
-            check=False,
-        )
-        if result.returncode != 0:
-            logger.warning(
-                "Failed to remove worktree '%s': %s",
-                worktree_path,
-                (result.stderr or result.stdout or "unknown error").strip(),
-            )
-            if worktree_path.exists():
-                shutil.rmtree(worktree_path, ignore_errors=True)
-
-        git_run(["worktree", "prune"], project_dir, check=False)
+    def close(self) -> None:
+        """Remove all idle pooled worktrees."""
+        with self._pools_lock:
+            pools = list(self._worktree_pools.values())
+            self._worktree_pools.clear()
+        for pool in pools:
+            pool.close()
 
     def _merge_worktree_branch(self, branch: str, project_dir: Path) -> Tuple[bool, str]:
         """Merge worktree branch back to main via existing merge helper."""
         return merge_branch(branch, project_dir)
 
 
+def _iter_files(root: Path) -> Iterator[str]:
+    """Yield file paths below root with one scandir per directory (like rglob("*")).
+
+    Directory-entry type bits from readdir avoid a stat per entry; symlinked
+    directories are not descended into, matching Path.rglob. Paths are
+    yielded as strings to avoid building a Path per file.
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+
 class ContentHandler(NodeHandler):
     """Execute non-software content-production nodes without git operations."""
 
@@ -1368,7 +2158,7 @@ class ContentHandler(NodeHandler):
         if node.inputs:
             parts.append(
                 "NODE_INPUTS:\n"
-                + json.dumps(node.inputs, indent=2, sort_keys=True, ensure_ascii=True)
+                + _PROMPT_JSON_ENCODER.encode(node.inputs)
             )
         if upstream_context:
             parts.append(f"UPSTREAM_CONTEXT:\n{upstream_context}")
@@ -1401,21 +2191,61 @@ class ContentHandler(NodeHandler):
             if output_path.is_file():
                 return ([self._relative_path(output_path, project_dir)], None)
 
-            files = sorted(path for path in output_path.rglob("*") if path.is_file())
+            files = self._relative_file_paths(output_path, project_dir)
             if not files:
                 return (
                     [],
                     f"Output directory '{output_path_text}' contains no files",
                 )
-            return ([self._relative_path(path, project_dir) for path in files], None)
+            return (files, None)
 
-        generated_files = sorted(path for path in work_dir.rglob("*") if path.is_file())
+        generated_files = self._relative_file_paths(work_dir, project_dir)
         if not generated_files:
             return (
                 [],
                 f"Node '{node.id}' produced no files in '{work_dir}' and no output_path was provided",
             )
-        return ([self._relative_path(path, project_dir) for path in generated_files], None)
+        return (generated_files, None)
+
+    @staticmethod
+    def _relative_file_paths(root: Path, project_dir: Path) -> List[str]:
+        """List files under root, sorted like Paths, relative to project root.
+
+        Both roots are resolved once and the walk stays on the resolved tree,
+        so a string prefix strip replaces a resolve()/relative_to() per file.
+        """
+        prefix = str(project_dir.resolve()) + os.sep
+        files = sorted(_iter_files(root.resolve()), key=lambda path: path.split(os.sep))
+        return [path.removeprefix(prefix) for path in files]
+
+
+_SIMPLE_KEYWORDS = ("report", "presentation", "document", "slides")
+_COMPLEX_KEYWORDS = ("build", "implement", "system", "architecture", "infrastructure")
+_CHOICE_KEYWORDS = ("or", "vs", "versus", "choice", "decide")
+_INTEGRATION_KEYWORDS = ("integrate", "api", "third-party", "external")
+_UNCERTAINTY_KEYWORDS = ("not sure", "maybe", "could be", "options")
+_EXPLICIT_FORMAT_KEYWORDS = ("powerpoint", "slide deck", "format", "template")
+_SINGLE_APPROACH_KEYWORDS = ("single", "straightforward", "obvious")
+
+# Every complexity keyword is a whole word or phrase and none overlaps
+# another, so one alternation scan finds the same keywords as searching
+# for each one separately.
+_COMPLEXITY_KEYWORD_PATTERN = re.compile(
+    r"\b(?:%s)\b" % "|".join(
+        re.escape(keyword)
+        for keyword in sorted(
+            _SIMPLE_KEYWORDS
+            + _COMPLEX_KEYWORDS
+            + _CHOICE_KEYWORDS
+            + _INTEGRATION_KEYWORDS
+            + _UNCERTAINTY_KEYWORDS
+            + _EXPLICIT_FORMAT_KEYWORDS
+            + _SINGLE_APPROACH_KEYWORDS,
+            key=len,
+            reverse=True,
+        )
+    )
+)
 
 
 class DiscoveryHandler(NodeHandler):
@@ -1539,45 +2369,29 @@ class DiscoveryHandler(NodeHandler):
         simple_reasons: List[str] = []
         complex_reasons: List[str] = []
 
-        simple_keywords = ("report", "presentation", "document", "slides")
-        complex_keywords = (
-            "build",
-            "implement",
-            "system",
-            "architecture",
-            "infrastructure",
-        )
-        choice_keywords = ("or", "vs", "versus", "choice", "decide")
-        integration_keywords = ("integrate", "api", "third-party", "external")
-        uncertainty_keywords = ("not sure", "maybe", "could be", "options")
+        found = set(_COMPLEXITY_KEYWORD_PATTERN.findall(text))
 
-        for keyword in simple_keywords:
-            if re.search(rf"\b{re.escape(keyword)}\b", text):
+        for keyword in _SIMPLE_KEYWORDS:
+            if keyword in found:
                 simple_reasons.append(f"simple keyword '{keyword}'")
-        for keyword in complex_keywords:
-            if re.search(rf"\b{re.escape(keyword)}\b", text):
+        for keyword in _COMPLEX_KEYWORDS:
+            if keyword in found:
                 complex_reasons.append(f"complex keyword '{keyword}'")
-        for keyword in choice_keywords:
-            if re.search(rf"\b{re.escape(keyword)}\b", text):
+        for keyword in _CHOICE_KEYWORDS:
+            if keyword in found:
                 complex_reasons.append(f"approach-choice keyword '{keyword}'")
                 break
-        for keyword in integration_keywords:
-            if re.search(rf"\b{re.escape(keyword)}\b", text):
+        for keyword in _INTEGRATION_KEYWORDS:
+            if keyword in found:
                 complex_reasons.append(f"integration keyword '{keyword}'")
-        for keyword in uncertainty_keywords:
-            if re.search(rf"\b{re.escape(keyword)}\b", text):
+        for keyword in _UNCERTAINTY_KEYWORDS:
+            if keyword in found:
                 complex_reasons.append(f"uncertainty keyword '{keyword}'")
                 break
 
-        explicit_format_patterns = (
-            r"\bpowerpoint\b",
-            r"\bslide deck\b",
-            r"\bformat\b",
-            r"\btemplate\b",
-        )
-        if any(re.search(pattern, text) for pattern in explicit_format_patterns):
+        if found.intersection(_EXPLICIT_FORMAT_KEYWORDS):
             simple_reasons.append("explicit format constraint detected")
-        if re.search(r"\b(single|straightforward|obvious)\b", text):
+        if found.intersection(_SINGLE_APPROACH_KEYWORDS):
             simple_reasons.append("single reasonable approach indicated")
 
         if complex_reasons:
@@ -1728,30 +2542,33 @@ class DiscoveryHandler(NodeHandler):
 
     def _outcome_description(self, node: GraphNode) -> str:
         """Extract the best available outcome description from node payload."""
-        candidates = [
-            node.inputs.get("outcome_description"),
-            node.inputs.get("outcome"),
-            node.inputs.get("goal"),
-            node.inputs.get("description"),
-            node.name,
-            node.id,
-        ]
-        for value in candidates:
-            text = str(value or "").strip()
-            if text:
-                return text
-        return node.id
+        for key in ("outcome_description", "outcome", "goal", "description"):
+            value = node.inputs.get(key)
+            if value:
+                text = str(value).strip()
+                if text:
+                    return text
+        return str(node.name or "").strip() or str(node.id or "").strip() or node.id
 
     def _extract_constraints(self, node: GraphNode) -> List[str]:
         """Collect and normalize constraints from graph node fields."""
-        collected: List[str] = []
-        collected.extend(str(item).strip() for item in node.criteria if str(item).strip())
+        # Case-insensitive, order-preserving dedupe: first spelling wins.
+        deduped: Dict[str, str] = {}
+
+        def add(value: Any) -> None:
+            text = str(value).strip()
+            if text:
+                deduped.setdefault(text.lower(), text)
+
+        for item in node.criteria:
+            add(item)
 
         raw_constraints = node.inputs.get("constraints")
         if isinstance(raw_constraints, list):
-            collected.extend(str(item).strip() for item in raw_constraints if str(item).strip())
-        elif isinstance(raw_constraints, str) and raw_constraints.strip():
-            collected.append(raw_constraints.strip())
+            for item in raw_constraints:
+                add(item)
+        elif isinstance(raw_constraints, str):
+            add(raw_constraints)
 
         for key in ("constraint", "format", "output_format", "format_constraints"):
             value = node.inputs.get(key)
@@ -1759,42 +2576,33 @@ class DiscoveryHandler(NodeHandler):
                 continue
             text = str(value).strip()
             if text:
-                collected.append(f"{key}: {text}")
+                add(f"{key}: {text}")
 
-        deduped: List[str] = []
-        seen: Set[str] = set()
-        for item in collected:
-            normalized = item.strip()
-            if not normalized:
-                continue
-            key = normalized.lower()
-            if key in seen:
-                continue
-            seen.add(key)
-            deduped.append(normalized)
-        return deduped
+        return list(deduped.values())
 
 
-def detect_domain(outcomes_content: str) -> DomainType:
-    """Infer orchestration domain from outcomes text using keyword density."""
-    software_keywords = (
+# One alternation per category so detection scans the text once per category.
+# No keyword is a prefix of another in its list, so hit counts match scanning
+# each keyword separately.
+_SOFTWARE_DOMAIN_PATTERN = re.compile(
+    r"\b(?:%s)\w*\b" % "|".join(map(re.escape, (
         "git", "code", "test", "deploy", "api", "function", "class",
         "module", "build", "compile", "commit", "branch", "merge",
-    )
-    content_keywords = (
+    )))
+)
+_CONTENT_DOMAIN_PATTERN = re.compile(
+    r"\b(?:%s)\w*\b" % "|".join(map(re.escape, (
         "write", "draft", "publish", "research", "report", "article",
         "document", "review", "edit", "commentary", "presentation",
-    )
+    )))
+)
 
+
+def detect_domain(outcomes_content: str) -> DomainType:
+    """Infer orchestration domain from outcomes text using keyword density."""
     text = str(outcomes_content or "").lower()
-    software_hits = sum(
-        len(re.findall(rf"\b{re.escape(keyword)}\w*\b", text))
-        for keyword in software_keywords
-    )
-    content_hits = sum(
-        len(re.findall(rf"\b{re.escape(keyword)}\w*\b", text))
-        for keyword in content_keywords
-    )
+    software_hits = sum(1 for _ in _SOFTWARE_DOMAIN_PATTERN.finditer(text))
+    content_hits = sum(1 for _ in _CONTENT_DOMAIN_PATTERN.finditer(text))
 
     if software_hits == 0 and content_hits == 0:
         logger.info(
@@ -1827,16 +2635,78 @@ def detect_domain(outcomes_content: str) -> DomainType:
 # Checkpoint manager
 # ---------------------------------------------------------------------------
 
+# Shared encoders: json.dumps() with non-default options builds a new
+# JSONEncoder per call. The canonical encoder's settings are part of the
+# graph hash and must not change, or existing checkpoints stop matching.
+_CANONICAL_JSON_ENCODER = json.JSONEncoder(
+    sort_keys=True,
+    separators=(",", ":"),
+    ensure_ascii=True,
+)
+_CHECKPOINT_ENCODER = json.JSONEncoder(separators=(",", ":"))
+# Node inputs/parameters embedded in agent prompts keep the readable layout.
+_PROMPT_JSON_ENCODER = json.JSONEncoder(indent=2, sort_keys=True, ensure_ascii=True)
+
+
 def _compute_graph_hash(graph: Graph) -> str:
     """Compute deterministic SHA256 hash for graph structure."""
     canonical_graph = _graph_to_payload(graph)
-    canonical_str = json.dumps(
-        canonical_graph,
-        sort_keys=True,
-        separators=(",", ":"),
-        ensure_ascii=True,
-    )
-    return hashlib.sha256(canonical_str.encode("utf-8")).hexdigest()
+    canonical_str = _CANONICAL_JSON_ENCODER.encode(canonical_graph)
+    return hashlib.sha256(canonical_str.encode("ascii")).hexdigest()
+
+
+def _atomic_write_bytes(path: Path, data: bytes, durable: bool = True) -> None:
+    """Write data to path via a sibling temp file, os.replace() and dir fsync.
+
+    With durable=False the replace is still atomic but neither the file nor
+    the directory is fsynced; callers must sync later for crash durability.
+    """
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        try:
+            # Write the pre-encoded payload straight to the descriptor; a
+            # buffered file object adds nothing for a single bytes blob.
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            if durable:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    if durable:
+        _fsync_directory(path.parent)
+
+
+def _fsync_file(path: Path) -> None:
+    """Flush an already-written file's contents to disk."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry update (rename) to disk where supported."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    try:
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
 
 
 def _enum_or_value(value: Any) -> Any:
@@ -1895,16 +2765,40 @@ def _graph_to_payload(graph: Graph) -> Dict[str, Any]:
 class CheckpointManager:
     """Persist and recover per-node graph execution state."""
 
-    def __init__(self, run_dir: str, graph: Graph):
+    def __init__(
+        self,
+        run_dir: str,
+        graph: Graph,
+        fsync_mode: str = DEFAULT_CHECKPOINT_FSYNC,
+    ):
         self.logger = logging.getLogger("orchestrator")
         self.run_dir = Path(run_dir)
+        if fsync_mode not in CHECKPOINT_FSYNC_MODES:
+            raise ValueError(f"Unknown checkpoint fsync mode '{fsync_mode}'")
+        self.fsync_mode = fsync_mode
         self.graph = graph
         self.graph_engine = GraphEngine(graph)
+        # Serializes state mutation and checkpoint writes across node workers.
+        self._lock = threading.RLock()
+        # Orders checkpoint file writes; always taken before _lock.
+        self._write_lock = threading.Lock()
+        # Node transitions mark the checkpoint dirty; a background writer
+        # coalesces them into one write per CHECKPOINT_WRITE_DELAY window.
+        self._dirty = False
+        # Set after a deferred (non-fsynced) write until flush() syncs it.
+        self._unsynced = False
+        self._writer: Optional[threading.Thread] = None
+        self._writer_wakeup = threading.Event()
+        self._closed = threading.Event()
         self.checkpoint_path = self.run_dir / "checkpoint.json"
-        self.temp_checkpoint_path = self.run_dir / "checkpoint.json.tmp"
         self.graph_snapshot_path = self.run_dir / "graph.json"
-        self.temp_graph_snapshot_path = self.run_dir / "graph.json.tmp"
         self.graph_hash = self._compute_graph_hash(graph)
+        # Serialized node entries, kept in sync at each node mutation so
+        # checkpoint writes do not rebuild every node's fields.
+        self._payload_nodes: Dict[str, Dict[str, Any]] = {}
+        # Normalized node statuses in state.nodes order, maintained alongside
+        # _payload_nodes so get_status_map() is a plain dict copy.
+        self._status_map: Dict[str, str] = {}
 
         generated_run_id = self._generate_run_id()
         existing_state = self._load_checkpoint()
@@ -1912,6 +2806,7 @@ class CheckpointManager:
         if existing_state is None:
             self.state = self._new_checkpoint_state(generated_run_id)
             self.run_id = self.state.run_id
+            self._rebuild_payload_nodes()
             self._write_graph_snapshot()
             return
 
@@ -1921,6 +2816,7 @@ class CheckpointManager:
             )
             self.state = self._new_checkpoint_state(generated_run_id)
             self.run_id = self.state.run_id
+            self._rebuild_payload_nodes()
             self._write_graph_snapshot()
             return
 
@@ -1958,6 +2854,8 @@ class CheckpointManager:
             self._reset_node_checkpoint(checkpoint)
             changed = True
 
+        self._rebuild_payload_nodes()
+
         # Missing summaries are a quality signal only; keep completed status.
         for node_id, checkpoint in self.state.nodes.items():
             if _normalize_node_status(checkpoint.status) != NodeStatus.COMPLETED.value:
@@ -1979,90 +2877,169 @@ class CheckpointManager:
         """Compute deterministic SHA256 hash for graph structure."""
         return _compute_graph_hash(graph)
 
-    def _write_checkpoint(self) -> None:
+    def _write_checkpoint(self, durable: bool = True) -> None:
         """Write checkpoint state atomically using write-then-rename."""
-        self.run_dir.mkdir(parents=True, exist_ok=True)
-        self.state.updated_at = self._utc_timestamp()
-
-        payload = {
-            "run_id": self.state.run_id,
-            "graph_hash": self.state.graph_hash,
-            "nodes": {},
-            "created_at": self.state.created_at,
-            "updated_at": self.state.updated_at,
-            "gate_retries": self.state.gate_retries,
-        }
-        for node_id in sorted(self.state.nodes):
-            node_state = self.state.nodes[node_id]
-            payload["nodes"][node_id] = {
-                "status": _normalize_node_status(node_state.status),
-                "started_at": node_state.started_at,
-                "completed_at": node_state.completed_at,
-                "output_summary": node_state.output_summary,
-                "model_used": node_state.model_used,
-                "artifacts": list(node_state.artifacts),
-                "error_details": node_state.error_details,
-            }
+        with self._write_lock:
+            with self._lock:
+                self._dirty = False
+                self.state.updated_at = self._utc_timestamp()
+                if len(self._payload_nodes) != len(self.state.nodes):
+                    self._rebuild_payload_nodes()
+                payload = {
+                    "run_id": self.state.run_id,
+                    "graph_hash": self.state.graph_hash,
+                    "nodes": self._payload_nodes,
+                    "created_at": self.state.created_at,
+                    "updated_at": self.state.updated_at,
+                    "gate_retries": self.state.gate_retries,
+                }
+                # Compact encoding: checkpoints are rewritten on every node transition.
+                data = _CHECKPOINT_ENCODER.encode(payload).encode("utf-8") + b"\n"
+                completed = sum(
+                    1
+                    for node in self._payload_nodes.values()
+                    if node["status"] == NodeStatus.COMPLETED.value
+                )
+                total = len(self._payload_nodes)
+
+            self.run_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write_bytes(self.checkpoint_path, data, durable=durable)
+            self._unsynced = not durable
+        self.logger.info("Checkpoint written: %d/%d nodes complete", completed, total)
 
-        with self.temp_checkpoint_path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2, sort_keys=True)
-            handle.write("\n")
-            handle.flush()
-            os.fsync(handle.fileno())
+    def _mark_dirty(self) -> None:
+        """Schedule a checkpoint write for the latest in-memory state."""
+        with self._lock:
+            self._dirty = True
+            closed = self._closed.is_set()
+            if not closed and self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._checkpoint_writer_loop,
+                    name="checkpoint-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+                # Don't lose a pending write if the process exits without close().
+                atexit.register(self.close)
+                with _shutdown_tracking_lock:
+                    _pending_checkpoints.add(self)
+        if closed:
+            # Writer already stopped; persist synchronously.
+            self._write_checkpoint()
+            return
+        self._writer_wakeup.set()
+
+    def _checkpoint_writer_loop(self) -> None:
+        """Write pending checkpoint state, coalescing bursts of updates."""
+        while not self._closed.is_set():
+            self._writer_wakeup.wait()
+            # Let further transitions land before paying for the fsync.
+            self._closed.wait(CHECKPOINT_WRITE_DELAY)
+            self._writer_wakeup.clear()
+            try:
+                if self._dirty:
+                    self._write_checkpoint(durable=self.fsync_mode == "always")
+            except OSError as exc:
+                self.logger.warning("Failed to write checkpoint: %s", exc)
 
-        os.rename(self.temp_checkpoint_path, self.checkpoint_path)
+    def flush(self) -> None:
+        """Write any pending state change and make the checkpoint durable."""
+        if self._dirty:
+            self._write_checkpoint()
+            return
+        if self._unsynced:
+            with self._write_lock:
+                if self._unsynced:
+                    _fsync_file(self.checkpoint_path)
+                    _fsync_directory(self.run_dir)
+                    self._unsynced = False
+
+    def close(self) -> None:
+        """Flush pending state and stop the background checkpoint writer."""
+        atexit.unregister(self.close)
+        with _shutdown_tracking_lock:
+            _pending_checkpoints.discard(self)
+        self._closed.set()
+        self._writer_wakeup.set()
+        if self._writer is not None:
+            self._writer.join()
+        self.flush()
 
-        completed = sum(
-            1
-            for node in self.state.nodes.values()
-            if _normalize_node_status(node.status) == NodeStatus.COMPLETED.value
-        )
-        total = len(self.state.nodes)
-        self.logger.info("Checkpoint written: %d/%d nodes complete", completed, total)
+    @staticmethod
+    def _node_payload(node_state: NodeCheckpoint) -> Dict[str, Any]:
+        """Build the serialized checkpoint entry for one node."""
+        return {
+            "status": _normalize_node_status(node_state.status),
+            "started_at": node_state.started_at,
+            "completed_at": node_state.completed_at,
+            "output_summary": node_state.output_summary,
+            "model_used": node_state.model_used,
+            "artifacts": node_state.artifacts,
+            "error_details": node_state.error_details,
+        }
+
+    def _rebuild_payload_nodes(self) -> None:
+        """Rebuild all serialized node entries (sorted) and the status map."""
+        self._payload_nodes = {
+            node_id: self._node_payload(self.state.nodes[node_id])
+            for node_id in sorted(self.state.nodes)
+        }
+        self._status_map = {
+            node_id: self._payload_nodes[node_id]["status"]
+            for node_id in self.state.nodes
+        }
+
+    def _update_node_payload(self, node_id: str) -> None:
+        """Refresh the serialized checkpoint entry for a single node."""
+        if node_id not in self._payload_nodes:
+            self._rebuild_payload_nodes()
+            return
+        payload = self._node_payload(self.state.nodes[node_id])
+        self._payload_nodes[node_id] = payload
+        self._status_map[node_id] = payload["status"]
 
     def _write_graph_snapshot(self) -> None:
         """Persist graph topology for operational commands (validate/invalidate)."""
         self.run_dir.mkdir(parents=True, exist_ok=True)
         payload = _graph_to_payload(self.graph)
-        with self.temp_graph_snapshot_path.open("w", encoding="utf-8") as handle:
-            json.dump(payload, handle, indent=2, sort_keys=True)
-            handle.write("\n")
-            handle.flush()
-            os.fsync(handle.fileno())
-        os.rename(self.temp_graph_snapshot_path, self.graph_snapshot_path)
+        _atomic_write_bytes(
+            self.graph_snapshot_path,
+            _CANONICAL_JSON_ENCODER.encode(payload).encode("ascii") + b"\n",
+        )
 
     def record_node_completion(self, node_id: str, outcome: NodeOutcome) -> None:
-        """Record node completion data and persist checkpoint immediately."""
-        node_checkpoint = self._ensure_node_checkpoint(node_id)
-        node_checkpoint.status = _normalize_node_status(outcome.status)
-        node_checkpoint.completed_at = self._utc_timestamp()
-        summary = str(outcome.output_summary or "")
-        node_checkpoint.output_summary = summary[:2000]
-        node_checkpoint.model_used = str(outcome.model_used or "")
-        node_checkpoint.artifacts = list(outcome.artifacts or [])
-        node_checkpoint.error_details = (
-            None if outcome.error_details is None else str(outcome.error_details)
-        )
-        self._write_checkpoint()
+        """Record node completion data and schedule a checkpoint write."""
+        with self._lock:
+            node_checkpoint = self._ensure_node_checkpoint(node_id)
+            node_checkpoint.status = _normalize_node_status(outcome.status)
+            node_checkpoint.completed_at = self._utc_timestamp()
+            summary = str(outcome.output_summary or "")
+            node_checkpoint.output_summary = summary[:2000]
+            node_checkpoint.model_used = str(outcome.model_used or "")
+            node_checkpoint.artifacts = list(outcome.artifacts or [])
+            node_checkpoint.error_details = (
+                None if outcome.error_details is None else str(outcome.error_details)
+            )
+            self._update_node_payload(node_id)
+        self._mark_dirty()
 
     def record_node_start(self, node_id: str, model: str) -> None:
-        """Record node start and selected model, then persist checkpoint."""
-        node_checkpoint = self._ensure_node_checkpoint(node_id)
-        node_checkpoint.status = NodeStatus.IN_PROGRESS.value
-        node_checkpoint.started_at = self._utc_timestamp()
-        node_checkpoint.completed_at = None
-        node_checkpoint.model_used = str(model or "")
-        node_checkpoint.output_summary = None
-        node_checkpoint.artifacts = []
-        node_checkpoint.error_details = None
-        self._write_checkpoint()
+        """Record node start and selected model, then schedule a checkpoint write."""
+        with self._lock:
+            node_checkpoint = self._ensure_node_checkpoint(node_id)
+            node_checkpoint.status = NodeStatus.IN_PROGRESS.value
+            node_checkpoint.started_at = self._utc_timestamp()
+            node_checkpoint.completed_at = None
+            node_checkpoint.model_used = str(model or "")
+            node_checkpoint.output_summary = None
+            node_checkpoint.artifacts = []
+            node_checkpoint.error_details = None
+            self._update_node_payload(node_id)
+        self._mark_dirty()
 
     def get_status_map(self) -> Dict[str, str]:
         """Return node status map from current checkpoint state."""
-        return {
-            node_id: _normalize_node_status(node_state.status)
-            for node_id, node_state in self.state.nodes.items()
-        }
+        return dict(self._status_map)
 
     def get_output_summary(self, node_id: str) -> Optional[str]:
         """Return node output summary from checkpoint if present."""
@@ -2079,14 +3056,15 @@ class CheckpointManager:
         return list(node_state.artifacts)
 
     def increment_gate_retry(self, gate_node_id: str) -> int:
-        """Increment and persist retry attempt count for a gate node."""
+        """Increment and record retry attempt count for a gate node."""
         gate_id = str(gate_node_id).strip()
         if not gate_id:
             return 0
-        current = int(self.state.gate_retries.get(gate_id, 0))
-        updated = max(0, current) + 1
-        self.state.gate_retries[gate_id] = updated
-        self._write_checkpoint()
+        with self._lock:
+            current = int(self.state.gate_retries.get(gate_id, 0))
+            updated = max(0, current) + 1
+            self.state.gate_retries[gate_id] = updated
+        self._mark_dirty()
         return updated
 
     def get_gate_retry_count(self, gate_node_id: str) -> int:
@@ -2099,45 +3077,47 @@ class CheckpointManager:
     def invalidate_nodes(self, node_ids: List[str]) -> List[str]:
         """Reset selected nodes and all downstream nodes to pending."""
         to_reset: Set[str] = set()
-        queue: deque[str] = deque(node_ids)
-
-        while queue:
-            node_id = queue.popleft()
-            if node_id in to_reset:
-                continue
+        unknown: List[str] = []
+        for node_id in node_ids:
             if node_id not in self.graph.nodes:
-                self.logger.warning(
-                    "Cannot invalidate unknown node '%s'; skipping",
-                    node_id,
-                )
+                unknown.append(node_id)
                 continue
-
             to_reset.add(node_id)
-            for downstream_id in self.graph_engine.get_downstream_nodes(node_id):
-                if downstream_id not in to_reset:
-                    queue.append(downstream_id)
+            to_reset.update(self.graph_engine.get_downstream_closure(node_id))
+
+        if unknown:
+            self.logger.warning(
+                "Cannot invalidate %d unknown node(s); skipping: %s",
+                len(unknown),
+                ", ".join(unknown),
+            )
 
         if not to_reset:
             return []
 
-        sorted_to_reset = sorted(to_reset)
-        for node_id in sorted_to_reset:
-            node_checkpoint = self._ensure_node_checkpoint(node_id)
-            self._reset_node_checkpoint(node_checkpoint)
-            self.logger.info("Invalidated node '%s' (reset to pending)", node_id)
+        with self._lock:
+            for node_id in to_reset:
+                node_checkpoint = self._ensure_node_checkpoint(node_id)
+                self._reset_node_checkpoint(node_checkpoint)
+                self._update_node_payload(node_id)
 
-        self._write_checkpoint()
+        # Sorted once for the return value and a single deterministic log line.
+        sorted_to_reset = sorted(to_reset)
+        self.logger.info(
+            "Invalidated %d node(s) (reset to pending): %s",
+            len(sorted_to_reset),
+            ", ".join(sorted_to_reset),
+        )
+        self._mark_dirty()
         return sorted_to_reset
 
     def _load_checkpoint(self) -> Optional[CheckpointState]:
         """Load checkpoint.json from disk if present and parse safely."""
-        if not self.checkpoint_path.exists():
-            return None
-
         try:
-            with self.checkpoint_path.open("r", encoding="utf-8") as handle:
-                raw_data = json.load(handle)
-        except (OSError, json.JSONDecodeError) as exc:
+            raw_data = json.loads(self.checkpoint_path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
             self.logger.warning(
                 "Failed to load checkpoint '%s': %s. Starting fresh.",
                 self.checkpoint_path,
@@ -2160,13 +3140,14 @@ class CheckpointManager:
             )
             return None
 
+        # Problems are collected per kind and logged once each, so a badly
+        # corrupted checkpoint does not emit one warning per node.
+        invalid_nodes: List[str] = []
+        invalid_artifacts: List[str] = []
         parsed_nodes: Dict[str, NodeCheckpoint] = {}
         for node_id, node_data in nodes_raw.items():
             if not isinstance(node_data, dict):
-                self.logger.warning(
-                    "Checkpoint node '%s' payload is invalid; resetting to pending",
-                    node_id,
-                )
+                invalid_nodes.append(str(node_id))
                 parsed_nodes[str(node_id)] = NodeCheckpoint(
                     status=NodeStatus.PENDING.value
                 )
@@ -2176,10 +3157,7 @@ class CheckpointManager:
             if isinstance(artifacts_raw, list):
                 artifacts = [str(item) for item in artifacts_raw if item is not None]
             else:
-                self.logger.warning(
-                    "Checkpoint node '%s' has non-list artifacts; defaulting to empty list",
-                    node_id,
-                )
+                invalid_artifacts.append(str(node_id))
                 artifacts = []
 
             parsed_nodes[str(node_id)] = NodeCheckpoint(
@@ -2194,19 +3172,35 @@ class CheckpointManager:
                 error_details=self._optional_text(node_data.get("error_details")),
             )
 
+        if invalid_nodes:
+            self.logger.warning(
+                "Checkpoint payload is invalid for %d node(s); resetting to pending: %s",
+                len(invalid_nodes),
+                ", ".join(invalid_nodes),
+            )
+        if invalid_artifacts:
+            self.logger.warning(
+                "Checkpoint has non-list artifacts for %d node(s); defaulting to empty list: %s",
+                len(invalid_artifacts),
+                ", ".join(invalid_artifacts),
+            )
+
         gate_retries_raw = raw_data.get("gate_retries", {})
         gate_retries: Dict[str, int] = {}
         if isinstance(gate_retries_raw, dict):
+            invalid_retries: List[str] = []
             for node_id, retries in gate_retries_raw.items():
                 try:
                     gate_retries[str(node_id)] = int(retries)
                 except (TypeError, ValueError):
-                    self.logger.warning(
-                        "Checkpoint gate_retries for node '%s' is invalid (%r); defaulting to 0",
-                        node_id,
-                        retries,
-                    )
+                    invalid_retries.append(f"{node_id}={retries!r}")
                     gate_retries[str(node_id)] = 0
+            if invalid_retries:
+                self.logger.warning(
+                    "Checkpoint gate_retries invalid for %d node(s); defaulting to 0: %s",
+                    len(invalid_retries),
+                    ", ".join(invalid_retries),
+                )
         else:
             self.logger.warning(
                 "Checkpoint has invalid gate_retries payload; defaulting to empty dict"
@@ -2272,18 +3266,15 @@ class CheckpointManager:
         """Convert nullable fields to stripped strings."""
         if value is None:
             return None
+        if type(value) is str and value and not value[0].isspace() and not value[-1].isspace():
+            return value
         text = str(value).strip()
         return text or None
 
     @staticmethod
     def _utc_timestamp() -> str:
         """Return current timestamp in ISO 8601 UTC format."""
-        return (
-            datetime.now(timezone.utc)
-            .replace(microsecond=0)
-            .isoformat()
-            .replace("+00:00", "Z")
-        )
+        return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
 
     @staticmethod
     def _generate_run_id() -> str:
@@ -2306,7 +3297,7 @@ class StylesheetLoader:
             "context_fidelity": "minimal",
             "max_gate_retries": 3,
         }
-        self._classes: Dict[str, ModelConfig] = self._build_default_classes()
+        self._classes: Dict[str, ModelConfig] = dict(_DEFAULT_MODEL_CLASSES)
 
         if self.stylesheet_path is None or not self.stylesheet_path.is_file():
             self.logger.info("Using default model stylesheet (no file found)")
@@ -2328,7 +3319,7 @@ class StylesheetLoader:
                     "Model stylesheet '%s' did not define any valid classes; using defaults",
                     self.stylesheet_path,
                 )
-                self._classes = self._build_default_classes()
+                self._classes = dict(_DEFAULT_MODEL_CLASSES)
 
             self.logger.info(
                 "Loaded model stylesheet: %d classes defined", len(self._classes)
@@ -2356,7 +3347,7 @@ class StylesheetLoader:
         if config is None:
             return self._hardcoded_fallback()
 
-        return self._clone_model_config(config)
+        return config
 
     def get_fallback_chain(self, node_class: str) -> List[ModelConfig]:
         """Return primary model followed by first-order fallback configs."""
@@ -2495,8 +3486,7 @@ class StylesheetLoader:
                 )
                 if fallback_model is not None:
                     # Keep fallback depth shallow in the chain list.
-                    fallback_model.fallback = []
-                    fallback_models.append(fallback_model)
+                    fallback_models.append(replace(fallback_model, fallback=()))
         elif "fallback" in entry:
             self.logger.warning(
                 "Stylesheet entry '%s' field 'fallback' must be a list; got %s",
@@ -2510,10 +3500,11 @@ class StylesheetLoader:
             reasoning_effort=reasoning_effort,
             tool_profile=tool_profile,
             timeout=timeout,
-            fallback=fallback_models,
+            fallback=tuple(fallback_models),
         )
 
-    def _build_default_classes(self) -> Dict[str, ModelConfig]:
+    @staticmethod
+    def _build_default_classes() -> Dict[str, ModelConfig]:
         """Build hardcoded defaults for environments without stylesheet file."""
         timeout = 7200
         classes: Dict[str, ModelConfig] = {
@@ -2523,15 +3514,15 @@ class StylesheetLoader:
                 reasoning_effort="xhigh",
                 tool_profile="claude",
                 timeout=timeout,
-                fallback=[
+                fallback=(
                     ModelConfig(
                         provider="openai",
                         model="gpt-5.3-codex",
                         reasoning_effort="xhigh",
                         tool_profile="codex",
                         timeout=timeout,
-                    )
-                ],
+                    ),
+                ),
             ),
             "implementation": ModelConfig(
                 provider="openai",
@@ -2539,15 +3530,15 @@ class StylesheetLoader:
                 reasoning_effort="medium",
                 tool_profile="codex",
                 timeout=timeout,
-                fallback=[
+                fallback=(
                     ModelConfig(
                         provider="anthropic",
                         model="claude-sonnet-4-6",
                         reasoning_effort="medium",
                         tool_profile="claude",
                         timeout=timeout,
-                    )
-                ],
+                    ),
+                ),
             ),
             "implementation-complex": ModelConfig(
                 provider="openai",
@@ -2598,7 +3589,7 @@ class StylesheetLoader:
                 tool_profile="claude",
                 timeout=timeout,
             ),
-            "default": self._hardcoded_fallback(),
+            "default": StylesheetLoader._hardcoded_fallback(),
         }
         return classes
 
@@ -2632,21 +3623,6 @@ class StylesheetLoader:
             return default
         return timeout
 
-    @staticmethod
-    def _clone_model_config(config: ModelConfig) -> ModelConfig:
-        """Copy model config deeply enough to avoid mutating loader cache."""
-        return ModelConfig(
-            provider=config.provider,
-            model=config.model,
-            reasoning_effort=config.reasoning_effort,
-            tool_profile=config.tool_profile,
-            timeout=config.timeout,
-            fallback=[
-                StylesheetLoader._clone_model_config(fallback)
-                for fallback in config.fallback
-            ],
-        )
-
     @staticmethod
     def _hardcoded_fallback() -> ModelConfig:
         """Return built-in fallback when class selection misses."""
@@ -2656,10 +3632,14 @@ class StylesheetLoader:
             reasoning_effort="medium",
             tool_profile="codex",
             timeout=7200,
-            fallback=[],
+            fallback=(),
         )
 
 
+# ModelConfig is frozen, so every loader can share one copy of the defaults.
+_DEFAULT_MODEL_CLASSES: Dict[str, ModelConfig] = StylesheetLoader._build_default_classes()
+
+
 # ---------------------------------------------------------------------------
 # 7.6 -- Structured signal parser
 # ---------------------------------------------------------------------------
@@ -2675,8 +3655,13 @@ def parse_signal(output: str) -> Dict[str, Any]:
     Returns a dict with at minimum a 'signal' key. On parse failure,
     returns an error signal with diagnostic information.
     """
-    parts = output.split(SIGNAL_MARKER)
-    if len(parts) < 3:
+    # The signal block sits at the end of the output, so search backwards for
+    # the LAST pair of markers (the agent may have echoed examples or
+    # documentation containing markers earlier). Unlike split(), this only
+    # touches the tail of multi-megabyte outputs.
+    end = output.rfind(SIGNAL_MARKER)
+    start = output.rfind(SIGNAL_MARKER, 0, end) if end > 0 else -1
+    if start < 0:
         # No valid signal found -- return error signal
         truncated = output[-500:] if len(output) > 500 else output
         return {
@@ -2686,9 +3671,7 @@ def parse_signal(output: str) -> Dict[str, Any]:
             "raw_tail": truncated,
         }
 
-    # Take the content between the LAST pair of markers (in case the agent
-    # echoed examples or documentation containing markers earlier).
-    yaml_text = parts[-2].strip()
+    yaml_text = output[start + len(SIGNAL_MARKER):end].strip()
     if not yaml_text:
         return {
             "signal": "error",
@@ -2723,6 +3706,12 @@ def parse_signal(output: str) -> Dict[str, Any]:
         }
 
 
+# "key: value" anchored at the start of an already-stripped line.
+_YAML_KEY_RE = re.compile(r"([\w-]+)\s*:\s*(.*)")
+# Bound once so the per-line parser calls skip the attribute lookup.
+_YAML_KEY_MATCH = _YAML_KEY_RE.match
+
+
 def _parse_simple_yaml(text: str) -> Dict[str, Any]:
     """Parse a simple YAML subset without external dependencies.
 
@@ -2736,40 +3725,39 @@ def _parse_simple_yaml(text: str) -> Dict[str, Any]:
     This is intentionally limited to the signal protocol format.
     """
     result: Dict[str, Any] = {}
-    lines = text.split("\n")
+    stripped_lines, indents = _split_yaml_lines(text)
+    lookahead = _content_lookahead(stripped_lines, indents)
     i = 0
 
-    while i < len(lines):
-        line = lines[i]
+    while i < len(stripped_lines):
+        stripped = stripped_lines[i]
 
         # Skip blank lines and comments
-        if not line.strip() or line.strip().startswith("#"):
+        if not stripped:
             i += 1
             continue
 
-        # Determine indentation level
-        indent = len(line) - len(line.lstrip())
+        indent = indents[i]
 
         # Top-level key: value
-        match = re.match(r'^(\s*)([\w_-]+)\s*:\s*(.*)', line)
+        match = _YAML_KEY_MATCH(stripped)
         if not match:
-            if line.strip() and not line.strip().startswith('#'):
-                logger.debug("Skipping unparseable YAML line %d: %s", i, line.strip()[:100])
+            logger.debug("Skipping unparseable YAML line %d: %s", i, stripped[:100])
             i += 1
             continue
 
-        key = match.group(2)
-        value_part = match.group(3).strip()
+        key = match.group(1)
+        value_part = match.group(2).strip()
 
         # Check if the next line starts an array or nested object
-        next_indent = _next_content_indent(lines, i + 1)
+        next_indent = _next_content_indent(lookahead, i + 1)
 
         if value_part == "" and next_indent is not None and next_indent > indent:
             # Could be a nested object or array
-            if _is_array_start(lines, i + 1):
-                result[key], i = _parse_array(lines, i + 1, indent)
+            if _is_array_start(lookahead, i + 1):
+                result[key], i = _parse_array(stripped_lines, indents, lookahead, i + 1, indent)
             else:
-                result[key], i = _parse_nested(lines, i + 1, indent)
+                result[key], i = _parse_nested(stripped_lines, indents, lookahead, i + 1, indent)
         else:
             result[key] = _parse_scalar(value_part)
             i += 1
@@ -2777,39 +3765,82 @@ def _parse_simple_yaml(text: str) -> Dict[str, Any]:
     return result
 
 
-def _next_content_indent(lines: List[str], start: int) -> Optional[int]:
+def _split_yaml_lines(text: str) -> Tuple[List[str], List[int]]:
+    """Split text into stripped lines and their indentation in one pass.
+
+    Blank and comment lines are stored as "" (indent 0) so the parsers skip
+    them with a plain truthiness check and never re-strip a line.
+    """
+    stripped_lines: List[str] = []
+    indents: List[int] = []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if not stripped or stripped[0] == "#":
+            stripped_lines.append("")
+            indents.append(0)
+        else:
+            stripped_lines.append(stripped)
+            indents.append(len(line) - len(line.lstrip()))
+    return stripped_lines, indents
+
+
+def _content_lookahead(
+    stripped_lines: List[str],
+    indents: List[int],
+) -> List[Optional[Tuple[int, bool]]]:
+    """Describe the next non-blank, non-comment line from each line index.
+
+    Slot j holds (indent, starts_array_item) for the first content line at or
+    after j, or None past the last one (one extra slot for end-of-input).
+    Built in a single backward pass so the parsers' lookaheads are plain
+    list reads instead of repeated string scans.
+    """
+    lookahead: List[Optional[Tuple[int, bool]]] = [None] * (len(stripped_lines) + 1)
+    following: Optional[Tuple[int, bool]] = None
+    for j in range(len(stripped_lines) - 1, -1, -1):
+        stripped = stripped_lines[j]
+        if stripped:
+            following = (indents[j], stripped.startswith("- "))
+        lookahead[j] = following
+    return lookahead
+
+
+def _next_content_indent(
+    lookahead: List[Optional[Tuple[int, bool]]],
+    start: int,
+) -> Optional[int]:
     """Return the indentation of the next non-blank line, or None."""
-    for j in range(start, len(lines)):
-        stripped = lines[j].strip()
-        if stripped and not stripped.startswith("#"):
-            return len(lines[j]) - len(lines[j].lstrip())
-    return None
+    following = lookahead[start]
+    return following[0] if following is not None else None
 
 
-def _is_array_start(lines: List[str], start: int) -> bool:
+def _is_array_start(lookahead: List[Optional[Tuple[int, bool]]], start: int) -> bool:
     """Check if the content at start begins with an array item (- prefix)."""
-    for j in range(start, len(lines)):
-        stripped = lines[j].strip()
-        if stripped and not stripped.startswith("#"):
-            return stripped.startswith("- ")
-    return False
+    following = lookahead[start]
+    return following is not None and following[1]
 
 
-def _parse_array(lines: List[str], start: int, parent_indent: int) -> tuple:
+def _parse_array(
+    stripped_lines: List[str],
+    indents: List[int],
+    lookahead: List[Optional[Tuple[int, bool]]],
+    start: int,
+    parent_indent: int,
+) -> tuple:
     """Parse a YAML array starting at 'start'. Returns (list, next_index)."""
     result: List[Any] = []
+    line_count = len(stripped_lines)
     i = start
 
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
+    while i < line_count:
+        stripped = stripped_lines[i]
 
         # Skip blank/comment lines
-        if not stripped or stripped.startswith("#"):
+        if not stripped:
             i += 1
             continue
 
-        current_indent = len(line) - len(line.lstrip())
+        current_indent = indents[i]
 
         # If we've de-dented back to or beyond parent, array is over
         if current_indent <= parent_indent:
@@ -2824,12 +3855,16 @@ def _parse_array(lines: List[str], start: int, parent_indent: int) -> tuple:
 
         # Empty item; parse nested value if present.
         if item_content == "":
-            next_indent = _next_content_indent(lines, i + 1)
+            next_indent = _next_content_indent(lookahead, i + 1)
             if next_indent is not None and next_indent > item_indent:
-                if _is_array_start(lines, i + 1):
-                    item_value, i = _parse_array(lines, i + 1, item_indent)
+                if _is_array_start(lookahead, i + 1):
+                    item_value, i = _parse_array(
+                        stripped_lines, indents, lookahead, i + 1, item_indent
+                    )
                 else:
-                    item_value, i = _parse_nested(lines, i + 1, item_indent)
+                    item_value, i = _parse_nested(
+                        stripped_lines, indents, lookahead, i + 1, item_indent
+                    )
                 result.append(item_value)
             else:
                 result.append("")
@@ -2837,7 +3872,7 @@ def _parse_array(lines: List[str], start: int, parent_indent: int) -> tuple:
             continue
 
         # Check if this array item starts an object (e.g. "- id: foo")
-        item_match = re.match(r'^([\w_-]+)\s*:\s*(.*)', item_content)
+        item_match = _YAML_KEY_MATCH(item_content)
         if not item_match:
             # Scalar array item
             result.append(_parse_scalar(item_content))
@@ -2853,15 +3888,15 @@ def _parse_array(lines: List[str], start: int, parent_indent: int) -> tuple:
             # The first key lives on "- key:", so nested content must be
             # indented beyond the virtual key indent (item indent + "- ").
             virtual_key_indent = item_indent + 2
-            next_indent = _next_content_indent(lines, i + 1)
+            next_indent = _next_content_indent(lookahead, i + 1)
             if next_indent is not None and next_indent > virtual_key_indent:
-                if _is_array_start(lines, i + 1):
+                if _is_array_start(lookahead, i + 1):
                     obj[first_key], i = _parse_array(
-                        lines, i + 1, virtual_key_indent
+                        stripped_lines, indents, lookahead, i + 1, virtual_key_indent
                     )
                 else:
                     obj[first_key], i = _parse_nested(
-                        lines, i + 1, virtual_key_indent
+                        stripped_lines, indents, lookahead, i + 1, virtual_key_indent
                     )
             else:
                 obj[first_key] = ""
@@ -2870,19 +3905,18 @@ def _parse_array(lines: List[str], start: int, parent_indent: int) -> tuple:
             obj[first_key] = _parse_scalar(first_value_part)
             i += 1
 
-        while i < len(lines):
-            next_line = lines[i]
-            next_stripped = next_line.strip()
+        while i < line_count:
+            next_stripped = stripped_lines[i]
 
-            if not next_stripped or next_stripped.startswith("#"):
+            if not next_stripped:
                 i += 1
                 continue
 
-            next_indent = len(next_line) - len(next_line.lstrip())
+            next_indent = indents[i]
             if next_indent <= item_indent:
                 break
 
-            field_match = re.match(r'^\s*([\w_-]+)\s*:\s*(.*)', next_line)
+            field_match = _YAML_KEY_MATCH(next_stripped)
             if not field_match:
                 logger.debug(
                     "Skipping unparseable YAML array object line %d: %s",
@@ -2895,15 +3929,15 @@ def _parse_array(lines: List[str], start: int, parent_indent: int) -> tuple:
             field_value_part = field_match.group(2).strip()
 
             if field_value_part == "":
-                child_indent = _next_content_indent(lines, i + 1)
+                child_indent = _next_content_indent(lookahead, i + 1)
                 if child_indent is not None and child_indent > next_indent:
-                    if _is_array_start(lines, i + 1):
+                    if _is_array_start(lookahead, i + 1):
                         obj[field_key], i = _parse_array(
-                            lines, i + 1, next_indent
+                            stripped_lines, indents, lookahead, i + 1, next_indent
                         )
                     else:
                         obj[field_key], i = _parse_nested(
-                            lines, i + 1, next_indent
+                            stripped_lines, indents, lookahead, i + 1, next_indent
                         )
                 else:
                     obj[field_key] = ""
@@ -2917,34 +3951,44 @@ def _parse_array(lines: List[str], start: int, parent_indent: int) -> tuple:
     return result, i
 
 
-def _parse_nested(lines: List[str], start: int, parent_indent: int) -> tuple:
+def _parse_nested(
+    stripped_lines: List[str],
+    indents: List[int],
+    lookahead: List[Optional[Tuple[int, bool]]],
+    start: int,
+    parent_indent: int,
+) -> tuple:
     """Parse a nested YAML object. Returns (dict, next_index)."""
     result: Dict[str, Any] = {}
+    line_count = len(stripped_lines)
     i = start
 
-    while i < len(lines):
-        line = lines[i]
-        stripped = line.strip()
+    while i < line_count:
+        stripped = stripped_lines[i]
 
-        if not stripped or stripped.startswith("#"):
+        if not stripped:
             i += 1
             continue
 
-        current_indent = len(line) - len(line.lstrip())
+        current_indent = indents[i]
         if current_indent <= parent_indent:
             break
 
-        match = re.match(r'^\s*([\w_-]+)\s*:\s*(.*)', line)
+        match = _YAML_KEY_MATCH(stripped)
         if match:
             key = match.group(1)
             value_part = match.group(2).strip()
 
-            next_indent = _next_content_indent(lines, i + 1)
+            next_indent = _next_content_indent(lookahead, i + 1)
             if value_part == "" and next_indent is not None and next_indent > current_indent:
-                if _is_array_start(lines, i + 1):
-                    result[key], i = _parse_array(lines, i + 1, current_indent)
+                if _is_array_start(lookahead, i + 1):
+                    result[key], i = _parse_array(
+                        stripped_lines, indents, lookahead, i + 1, current_indent
+                    )
                 else:
-                    result[key], i = _parse_nested(lines, i + 1, current_indent)
+                    result[key], i = _parse_nested(
+                        stripped_lines, indents, lookahead, i + 1, current_indent
+                    )
             else:
                 result[key] = _parse_scalar(value_part)
                 i += 1
@@ -2954,34 +3998,43 @@ def _parse_nested(lines: List[str], start: int, parent_indent: int) -> tuple:
     return result, i
 
 
+# Lowercased boolean/null spellings; the longest ("false") bounds the lookup.
+_YAML_SCALAR_CONSTANTS: Dict[str, Any] = {
+    "true": True,
+    "yes": True,
+    "false": False,
+    "no": False,
+    "null": None,
+    "~": None,
+}
+_YAML_SCALAR_CONSTANT_MAX_LEN = max(len(name) for name in _YAML_SCALAR_CONSTANTS)
+
+
 def _parse_scalar(value: str) -> Any:
     """Parse a scalar YAML value into a Python type."""
     if not value:
         return ""
 
     # Remove surrounding quotes
-    if (value.startswith('"') and value.endswith('"')) or \
-       (value.startswith("'") and value.endswith("'")):
+    first = value[0]
+    if (first == '"' or first == "'") and value[-1] == first:
         return value[1:-1]
 
-    # Booleans
-    lower = value.lower()
-    if lower in ("true", "yes"):
-        return True
-    if lower in ("false", "no"):
-        return False
-
-    # null
-    if lower in ("null", "~"):
-        return None
+    # Booleans and null
+    if len(value) <= _YAML_SCALAR_CONSTANT_MAX_LEN:
+        lower = value.lower()
+        if lower in _YAML_SCALAR_CONSTANTS:
+            return _YAML_SCALAR_CONSTANTS[lower]
 
-    # Numbers
-    try:
-        if "." in value:
-            return float(value)
-        return int(value)
-    except ValueError:
-        pass
+    # Numbers -- nothing starting with a letter parses here ("nan"/"inf" have
+    # no "." so never reach float()), so plain words skip the failed attempt.
+    if not first.isalpha():
+        try:
+            if "." in value:
+                return float(value)
+            return int(value)
+        except ValueError:
+            pass
 
     return value
 
@@ -3004,6 +4057,9 @@ def _parse_graph_signal(signal: Dict[str, Any]) -> Graph:
         )
         edges_data = []
 
+    # Defaults are passed as enum members (returned as-is by _coerce_enum) and
+    # alias lookups only run when the primary key is absent, keeping the
+    # per-node path to one dict probe per field.
     nodes: Dict[str, GraphNode] = {}
     for idx, node_data in enumerate(nodes_data):
         if not isinstance(node_data, dict):
@@ -3013,7 +4069,7 @@ def _parse_graph_signal(signal: Dict[str, Any]) -> Graph:
             )
             continue
 
-        node_id = str(node_data.get("id", "")).strip()
+        node_id = _as_text(node_data.get("id", ""))
         if not node_id:
             logger.warning("Skipping graph node at index %d: missing required field 'id'", idx)
             continue
@@ -3021,7 +4077,7 @@ def _parse_graph_signal(signal: Dict[str, Any]) -> Graph:
             logger.warning("Duplicate graph node id '%s' encountered; skipping duplicate", node_id)
             continue
 
-        node_name = str(node_data.get("name", "")).strip()
+        node_name = _as_text(node_data.get("name", ""))
         if not node_name:
             logger.warning(
                 "Graph node '%s' missing required field 'name'; defaulting to node id",
@@ -3029,15 +4085,16 @@ def _parse_graph_signal(signal: Dict[str, Any]) -> Graph:
             )
             node_name = node_id
 
-        raw_node_type = node_data.get("type", NodeType.TASK.value)
         node_type = _coerce_enum(
             NodeType,
-            raw_node_type,
+            node_data.get("type", NodeType.TASK),
             NodeType.TASK,
             f"graph node '{node_id}' type",
         )
 
-        node_class = str(node_data.get("class", node_data.get("node_class", ""))).strip()
+        node_class = _as_text(
+            node_data["class"] if "class" in node_data else node_data.get("node_class", "")
+        )
         if not node_class:
             logger.warning(
                 "Skipping graph node '%s': missing required field 'class'/'node_class'",
@@ -3045,7 +4102,7 @@ def _parse_graph_signal(signal: Dict[str, Any]) -> Graph:
             )
             continue
 
-        handler = str(node_data.get("handler", "")).strip()
+        handler = _as_text(node_data.get("handler", ""))
         if not handler:
             logger.warning(
                 "Skipping graph node '%s': missing required field 'handler'",
@@ -3060,7 +4117,7 @@ def _parse_graph_signal(signal: Dict[str, Any]) -> Graph:
             )
         context_fidelity = _coerce_enum(
             ContextFidelityMode,
-            node_data.get("context_fidelity", ContextFidelityMode.MINIMAL.value),
+            node_data.get("context_fidelity", ContextFidelityMode.MINIMAL),
             ContextFidelityMode.MINIMAL,
             f"graph node '{node_id}' context_fidelity",
         )
@@ -3078,16 +4135,19 @@ def _parse_graph_signal(signal: Dict[str, Any]) -> Graph:
             inputs = {}
 
         max_retries_raw = node_data.get("max_retries", 3)
-        try:
-            max_retries = int(max_retries_raw)
-        except (TypeError, ValueError):
-            logger.warning(
-                "Graph node '%s' has invalid max_retries=%r; defaulting to 3",
-                node_id, max_retries_raw,
-            )
-            max_retries = 3
+        if type(max_retries_raw) is int:
+            max_retries = max_retries_raw
+        else:
+            try:
+                max_retries = int(max_retries_raw)
+            except (TypeError, ValueError):
+                logger.warning(
+                    "Graph node '%s' has invalid max_retries=%r; defaulting to 3",
+                    node_id, max_retries_raw,
+                )
+                max_retries = 3
 
-        prd_path = node_data.get("prd_path", node_data.get("prd"))
+        prd_path = node_data["prd_path"] if "prd_path" in node_data else node_data.get("prd")
         branch = node_data.get("branch")
         output_path = node_data.get("output_path")
 
@@ -3145,8 +4205,8 @@ def _parse_graph_signal(signal: Dict[str, Any]) -> Graph:
             )
             continue
 
-        source = str(edge_data.get("source", "")).strip()
-        target = str(edge_data.get("target", "")).strip()
+        source = _as_text(edge_data.get("source", ""))
+        target = _as_text(edge_data.get("target", ""))
         if not source or not target:
             logger.warning(
                 "Skipping graph edge at index %d: required fields 'source' and 'target' must be non-empty",
@@ -3154,7 +4214,7 @@ def _parse_graph_signal(signal: Dict[str, Any]) -> Graph:
             )
             continue
 
-        condition = str(edge_data.get("condition", "always")).strip() or "always"
+        condition = _as_text(edge_data.get("condition", "always")) or "always"
         edges.append(
             GraphEdge(
                 source=source,
@@ -3183,18 +4243,33 @@ def _coerce_enum(
     if isinstance(raw_value, enum_type):
         return raw_value
 
-    candidate = str(raw_value).strip().lower()
+    candidate, member = _lookup_enum_text(enum_type, str(raw_value))
+    if member is not None:
+        return member
     if not candidate:
         return default
 
+    logger.warning(
+        "Invalid %s value '%s'; defaulting to '%s'",
+        label, candidate, default.value,
+    )
+    return default
+
+
+@lru_cache(maxsize=256)
+def _lookup_enum_text(enum_type: Any, raw_text: str) -> Tuple[str, Any]:
+    """Normalize enum text and resolve its member (None if unknown).
+
+    Graph payloads repeat the same handful of type/fidelity/domain strings
+    on every node, so the strip/lower and Enum() call are cached per text.
+    """
+    candidate = raw_text.strip().lower()
+    if not candidate:
+        return candidate, None
     try:
-        return enum_type(candidate)
+        return candidate, enum_type(candidate)
     except ValueError:
-        logger.warning(
-            "Invalid %s value '%s'; defaulting to '%s'",
-            label, candidate, default.value,
-        )
-        return default
+        return candidate, None
 
 
 def _as_string_list(value: Any, label: str) -> List[str]:
@@ -3213,12 +4288,18 @@ def _as_string_list(value: Any, label: str) -> List[str]:
     return []
 
 
+def _as_text(value: Any) -> str:
+    """Normalize a scalar to stripped text; parsed YAML values are mostly str."""
+    if type(value) is str:
+        return value.strip()
+    return str(value).strip()
+
+
 def _as_optional_str(value: Any) -> Optional[str]:
     """Normalize optional scalar values to stripped strings."""
     if value is None:
         return None
-    text = str(value).strip()
-    return text or None
+    return _as_text(value) or None
 
 
 # ---------------------------------------------------------------------------
@@ -3307,7 +4388,7 @@ def validate_outcomes(state: OrchestratorState) -> bool:
         return False
 
     try:
-        content = outcomes.read_text(encoding="utf-8").strip()
+        content = _read_cached(outcomes).strip()
     except OSError as exc:
         logger.error("Cannot read OUTCOMES.md: %s", exc)
         return False
@@ -3323,6 +4404,11 @@ def validate_outcomes(state: OrchestratorState) -> bool:
     return True
 
 
+_ROADMAP_STATUS_PATTERN = re.compile(
+    r"\*\*Status:\*\* (done|in_progress|blocked|backlog)"
+)
+
+
 def read_roadmap(state: OrchestratorState) -> Optional[str]:
     """Read ROADMAP.md for resume capability.
 
@@ -3335,16 +4421,17 @@ def read_roadmap(state: OrchestratorState) -> Optional[str]:
         return None
 
     try:
-        content = roadmap.read_text(encoding="utf-8")
+        content = _read_cached(roadmap)
     except OSError as exc:
         logger.error("Cannot read ROADMAP.md: %s", exc)
         return None
 
-    # Parse sprint statuses for resume logging
-    done_count = content.count("**Status:** done")
-    in_progress_count = content.count("**Status:** in_progress")
-    blocked_count = content.count("**Status:** blocked")
-    backlog_count = content.count("**Status:** backlog")
+    # Parse sprint statuses for resume logging (one pass over the file)
+    status_counts = Counter(_ROADMAP_STATUS_PATTERN.findall(content))
+    done_count = status_counts["done"]
+    in_progress_count = status_counts["in_progress"]
+    blocked_count = status_counts["blocked"]
+    backlog_count = status_counts["backlog"]
 
     total = done_count + in_progress_count + blocked_count + backlog_count
     if total > 0:
@@ -3360,11 +4447,14 @@ def read_roadmap(state: OrchestratorState) -> Optional[str]:
 # 7.5 -- Agent invocation via subprocess
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=1)
 def _agent_env() -> Dict[str, str]:
     """Return a clean environment for spawning agent subprocesses.
 
     Strips CLAUDECODE so that `claude --print` doesn't refuse to launch
     when the orchestrator is itself running inside a Claude Code session.
+    Built once per process: the orchestrator never modifies its own
+    environment, and subprocess only reads the mapping (do not mutate it).
     """
     env = os.environ.copy()
     env.pop("CLAUDECODE", None)
@@ -3402,6 +4492,10 @@ def _resolve_invocation_config(
     return resolved_profile, model_name, reasoning_effort
 
 
+# Tool profiles that run through the Codex CLI; everything else uses Claude.
+_CODEX_TOOL_PROFILES = frozenset({"codex", "gpt"})
+
+
 def _build_invoke_command(
     agent_name: str,
     context: str,
@@ -3413,18 +4507,7 @@ def _build_invoke_command(
 ) -> Tuple[List[str], str]:
     """Build a provider-native CLI command for agent invocation."""
     profile = str(tool_profile or "claude").strip().lower() or "claude"
-    if profile == "claude":
-        if context_file is not None:
-            return (
-                ["claude", "--print", "--agent", agent_name, "--prompt-file", str(context_file)],
-                "claude",
-            )
-        return (
-            ["claude", "--print", "--agent", agent_name, "-p", context],
-            "claude",
-        )
-
-    if profile in {"codex", "gpt"}:
+    if profile in _CODEX_TOOL_PROFILES:
         resolved_model = model_name or "gpt-5.3-codex"
         cmd = ["codex", "-m", resolved_model]
         if reasoning_effort != "medium":
@@ -3434,11 +4517,12 @@ def _build_invoke_command(
             cmd.append(context if context_file is None else str(context_file))
         return (cmd, "codex")
 
-    logger.warning(
-        "Unknown tool_profile '%s' for agent '%s'; defaulting to Claude CLI",
-        profile,
-        agent_name,
-    )
+    if profile != "claude":
+        logger.warning(
+            "Unknown tool_profile '%s' for agent '%s'; defaulting to Claude CLI",
+            profile,
+            agent_name,
+        )
     if context_file is not None:
         return (
             ["claude", "--print", "--agent", agent_name, "--prompt-file", str(context_file)],
@@ -3477,7 +4561,9 @@ def invoke_agent(
         model_config: Optional model configuration for provider-native routing
 
     Returns:
-        The agent's stdout output as a string.
+        The agent's stdout as a string. Output is streamed to the agent log
+        as it arrives; at most AGENT_OUTPUT_TAIL_BYTES (the end of the
+        output, where the signal block lives) are kept in memory.
 
     Raises:
         subprocess.TimeoutExpired: If the agent exceeds the timeout.
@@ -3505,7 +4591,7 @@ def invoke_agent(
         with os.fdopen(fd, "w", encoding="utf-8") as handle:
             handle.write(context)
         context_file_path = Path(temp_path)
-        use_stdin = resolved_profile in {"codex", "gpt"}
+        use_stdin = resolved_profile in _CODEX_TOOL_PROFILES
 
     cmd, cli_name = _build_invoke_command(
         agent_name,
@@ -3534,30 +4620,67 @@ def invoke_agent(
         timeout,
     )
     start_time = time.monotonic()
+    invocation = _reserve_agent_log(agent_name, cycle)
+    output_log = None
+    stdout_tail = bytearray()
+    stderr_tail = bytearray()
 
     try:
         if use_stdin and context_file_path is not None:
-            stdin_stream = context_file_path.open("r", encoding="utf-8")
-        result = subprocess.run(
+            stdin_stream = context_file_path.open("rb")
+        process = subprocess.Popen(
             cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             cwd=str(project_dir),
             env=_agent_env(),
             stdin=stdin_stream,
         )
+        with _shutdown_tracking_lock:
+            _agent_processes.add(process)
+        # Stream stdout straight into the agent log so hours of output never
+        # accumulate in memory; only the tail needed for the signal is kept.
+        output_log = _open_agent_output_log(invocation, agent_name, cycle)
+        pumps = [
+            threading.Thread(
+                target=_pump_agent_stream,
+                args=(process.stdout, output_log, stdout_tail, AGENT_OUTPUT_TAIL_BYTES),
+                daemon=True,
+            ),
+            threading.Thread(
+                target=_pump_agent_stream,
+                args=(process.stderr, None, stderr_tail, AGENT_STDERR_TAIL_BYTES),
+                daemon=True,
+            ),
+        ]
+        for pump in pumps:
+            pump.start()
+        try:
+            returncode = process.wait(timeout=timeout)
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            with _shutdown_tracking_lock:
+                _agent_processes.discard(process)
+            for pump in pumps:
+                pump.join()
     except subprocess.TimeoutExpired:
         elapsed = time.monotonic() - start_time
         logger.error(
             "Agent '%s' timed out after %.1fs (limit: %ds)",
             agent_name, elapsed, timeout,
         )
+        _close_agent_output_log(output_log, elapsed=elapsed)
+        output_log = None
         _log_agent_io(
             agent_name, cycle, context,
+            stderr=_decode_agent_stream(stderr_tail, AGENT_STDERR_TAIL_BYTES),
             elapsed=elapsed,
             error=f"Timed out after {elapsed:.1f}s (limit: {timeout}s)",
             command=command_for_logs,
+            invocation=invocation,
         )
         raise
     except FileNotFoundError:
@@ -3575,8 +4698,12 @@ def invoke_agent(
             agent_name, cycle, context,
             error=message,
             command=command_for_logs,
+            invocation=invocation,
         )
         raise RuntimeError(message)
+    except BaseException:
+        _close_agent_output_log(output_log)
+        raise
     finally:
         if stdin_stream is not None:
             stdin_stream.close()
@@ -3589,32 +4716,43 @@ def invoke_agent(
     elapsed = time.monotonic() - start_time
     logger.info(
         "Agent '%s' completed in %.1fs (exit code: %d)",
-        agent_name, elapsed, result.returncode,
+        agent_name, elapsed, returncode,
     )
+    _close_agent_output_log(output_log, elapsed=elapsed, exit_code=returncode)
+
+    stdout = _decode_agent_stream(stdout_tail, AGENT_OUTPUT_TAIL_BYTES)
+    stderr = _decode_agent_stream(stderr_tail, AGENT_STDERR_TAIL_BYTES)
+    if len(stdout_tail) > AGENT_OUTPUT_TAIL_BYTES:
+        logger.debug(
+            "Agent '%s' output exceeded %d bytes; full output is in the agent log",
+            agent_name,
+            AGENT_OUTPUT_TAIL_BYTES,
+        )
 
-    # Log full agent I/O for retrospective analysis
+    # Log agent context and stderr for retrospective analysis (stdout was
+    # streamed to the output log while the agent ran).
     _log_agent_io(
         agent_name, cycle, context,
-        output=result.stdout,
-        stderr=result.stderr,
+        stderr=stderr,
         elapsed=elapsed,
-        exit_code=result.returncode,
+        exit_code=returncode,
         command=command_for_logs,
+        invocation=invocation,
     )
 
-    if result.returncode != 0:
+    if returncode != 0:
         logger.warning(
             "Agent '%s' exited with code %d. stderr: %s",
-            agent_name, result.returncode, (result.stderr or "")[:500],
+            agent_name, returncode, stderr[:500],
         )
 
-    if not result.stdout and result.returncode != 0:
+    if not stdout and returncode != 0:
         raise RuntimeError(
-            f"Agent '{agent_name}' failed (exit code {result.returncode}) "
-            f"with no stdout. stderr: {(result.stderr or '')[:500]}"
+            f"Agent '{agent_name}' failed (exit code {returncode}) "
+            f"with no stdout. stderr: {stderr[:500]}"
         )
 
-    return result.stdout
+    return stdout
 
 
 def invoke_agent_async(
@@ -3639,22 +4777,198 @@ def invoke_agent_async(
     )
 
 
-# ---------------------------------------------------------------------------
-# Git helpers
-# ---------------------------------------------------------------------------
+# ---------------------------------------------------------------------------
+# Git helpers
+# ---------------------------------------------------------------------------
+
+# Graph nodes run concurrently, but they share the project's main checkout for
+# branch switching and merges. Operations touching it hold this lock.
+_git_lock = threading.RLock()
+
+# Resolved once so each git_run call skips the PATH search; falls back to
+# plain "git" so a missing binary still fails at call time as before.
+_GIT_BIN = shutil.which("git") or "git"
+
+
+def git_run(
+    args: List[str],
+    project_dir: Path,
+    check: bool = True,
+    timeout: Optional[float] = None,
+) -> subprocess.CompletedProcess:
+    """Run a git command in the project directory."""
+    cmd = [_GIT_BIN] + args
+    # Python's own descriptors are non-inheritable (PEP 446), so the
+    # child-side close_fds sweep buys nothing here.
+    return subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        cwd=str(project_dir),
+        check=check,
+        timeout=timeout,
+        close_fds=False,
+    )
+
+
+_GIT_SHA_RE = re.compile(r"[0-9a-f]{40}(?:[0-9a-f]{24})?")
+_git_dirs_cache: Dict[Path, Tuple[Path, Path]] = {}
+
+
+def _git_dirs(project_dir: Path) -> Optional[Tuple[Path, Path]]:
+    """Return (git_dir, common_dir) for a checkout, following .git files."""
+    cached = _git_dirs_cache.get(project_dir)
+    if cached is not None:
+        return cached
+
+    dot_git = project_dir / ".git"
+    if dot_git.is_dir():
+        git_dir = dot_git
+    elif dot_git.is_file():
+        # Linked worktree / submodule: ".git" holds "gitdir: <path>".
+        try:
+            content = dot_git.read_text(encoding="utf-8").strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+        if not content.startswith("gitdir:"):
+            return None
+        git_dir = project_dir / content[len("gitdir:"):].strip()
+    else:
+        return None
+
+    common_dir = git_dir
+    try:
+        commondir = (git_dir / "commondir").read_text(encoding="utf-8").strip()
+    except FileNotFoundError:
+        pass
+    except (OSError, UnicodeDecodeError):
+        return None
+    else:
+        common_dir = git_dir / commondir
+
+    _git_dirs_cache[project_dir] = (git_dir, common_dir)
+    return (git_dir, common_dir)
+
+
+def _read_local_branches(project_dir: Path) -> Optional[Dict[str, str]]:
+    """Read {branch: sha} from loose refs and packed-refs without spawning git.
+
+    Returns None when the ref store is not the plain files backend (reftable)
+    or contains anything unexpected, so callers can fall back to git itself.
+    """
+    dirs = _git_dirs(project_dir)
+    if dirs is None:
+        return None
+    common_dir = dirs[1]
+    if (common_dir / "reftable").exists():
+        return None
+
+    branches: Dict[str, str] = {}
+    try:
+        with (common_dir / "packed-refs").open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.startswith(("#", "^")):
+                    continue
+                sha, _, refname = line.rstrip("\n").partition(" ")
+                if refname.startswith("refs/heads/"):
+                    branches[refname[len("refs/heads/"):]] = sha
+    except FileNotFoundError:
+        pass
+
+    heads_dir = common_dir / "refs" / "heads"
+    prefix_len = len(str(heads_dir)) + 1
+    for dirpath, _, filenames in os.walk(heads_dir):
+        for filename in filenames:
+            if filename.endswith(".lock"):
+                continue
+            ref_path = os.path.join(dirpath, filename)
+            with open(ref_path, "r", encoding="utf-8") as handle:
+                sha = handle.read().strip()
+            if not _GIT_SHA_RE.fullmatch(sha):
+                # Symbolic or malformed ref -- let git resolve it.
+                return None
+            branches[ref_path[prefix_len:].replace(os.sep, "/")] = sha
+    return branches
+
+
+def load_branch_state(project_dir: Path) -> Dict[str, str]:
+    """Return {branch_name: commit_sha} for every local branch.
+
+    Reads the ref store directly when possible; otherwise uses a single
+    'git for-each-ref' call.
+    """
+    try:
+        branches = _read_local_branches(project_dir)
+    except (OSError, UnicodeDecodeError):
+        branches = None
+    if branches is not None:
+        return branches
+
+    result = git_run(
+        ["for-each-ref", "--format=%(refname) %(objectname)", "refs/heads"],
+        project_dir,
+        check=False,
+    )
+    branches: Dict[str, str] = {}
+    if result.returncode != 0:
+        return branches
+    for line in result.stdout.splitlines():
+        refname, _, sha = line.partition(" ")
+        if refname.startswith("refs/heads/") and sha:
+            branches[refname[len("refs/heads/"):]] = sha
+    return branches
+
+
+def _read_head(project_dir: Path) -> Optional[str]:
+    """Return the raw contents of a checkout's HEAD file, or None if unreadable."""
+    dirs = _git_dirs(project_dir)
+    if dirs is None:
+        return None
+    try:
+        return (dirs[0] / "HEAD").read_text(encoding="utf-8").strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _current_branch(project_dir: Path) -> Optional[str]:
+    """Return the checked-out branch name without spawning git.
+
+    None means detached HEAD or a HEAD that could not be read directly.
+    """
+    head = _read_head(project_dir)
+    if head is None or not head.startswith("ref: refs/heads/"):
+        return None
+    return head[len("ref: refs/heads/"):]
 
-def git_run(
-    args: List[str], project_dir: Path, check: bool = True
-) -> subprocess.CompletedProcess:
-    """Run a git command in the project directory."""
-    cmd = ["git"] + args
-    return subprocess.run(
-        cmd,
-        capture_output=True,
-        text=True,
-        cwd=str(project_dir),
-        check=check,
-    )
+
+def _read_head_sha(project_dir: Path, branches: Dict[str, str]) -> Optional[str]:
+    """Resolve HEAD of a checkout in-process using a branch->sha map."""
+    head = _read_head(project_dir)
+    if head is None:
+        return None
+    if head.startswith("ref: refs/heads/"):
+        return branches.get(head[len("ref: refs/heads/"):])
+    if _GIT_SHA_RE.fullmatch(head):
+        return head
+    return None
+
+
+def _preflight_worktree(
+    project_dir: Path,
+    branch: str,
+) -> Tuple[bool, Optional[str], Optional[str]]:
+    """Return (branch_exists, head_sha, main_sha) for worktree creation.
+
+    One ref-store read answers all three probes; git is only spawned when
+    the refs cannot be read directly.
+    """
+    branches = load_branch_state(project_dir)
+    main_sha = branches.get("main") or branches.get("master")
+    head_sha = _read_head_sha(project_dir, branches)
+    if head_sha is None:
+        result = git_run(["rev-parse", "--verify", "--quiet", "HEAD"], project_dir, check=False)
+        head_sha = result.stdout.strip() or None
+    return (branch in branches, head_sha, main_sha)
 
 
 def get_current_branch(project_dir: Path) -> str:
@@ -3699,11 +5013,14 @@ def create_branch(branch_name: str, project_dir: Path) -> bool:
     """Create and checkout a git branch. Returns True on success."""
     stashed = _stash_if_dirty(project_dir)
 
-    # Check if branch already exists
-    result = git_run(
-        ["rev-parse", "--verify", branch_name], project_dir, check=False
-    )
-    if result.returncode == 0:
+    # Check if branch already exists; only non-local names need git to resolve
+    branch_exists = branch_name in load_branch_state(project_dir)
+    if not branch_exists:
+        result = git_run(
+            ["rev-parse", "--verify", branch_name], project_dir, check=False
+        )
+        branch_exists = result.returncode == 0
+    if branch_exists:
         # Branch exists -- check it out
         logger.info("Branch '%s' exists, checking out", branch_name)
         checkout = git_run(["checkout", branch_name], project_dir, check=False)
@@ -3731,12 +5048,15 @@ def create_branch(branch_name: str, project_dir: Path) -> bool:
 
 def checkout_main(project_dir: Path) -> bool:
     """Checkout the main branch (tries 'main' then 'master')."""
+    branches = load_branch_state(project_dir)
+    target = "main" if "main" in branches else "master" if "master" in branches else None
+    if target is not None and _current_branch(project_dir) == target:
+        # Already there: skip the status/stash/checkout subprocesses.
+        return True
+
     stashed = _stash_if_dirty(project_dir)
     for branch in ("main", "master"):
-        result = git_run(
-            ["rev-parse", "--verify", branch], project_dir, check=False
-        )
-        if result.returncode == 0:
+        if branch in branches:
             checkout = git_run(["checkout", branch], project_dir, check=False)
             if stashed:
                 _stash_pop(project_dir)
@@ -3752,7 +5072,9 @@ def merge_branch(branch_name: str, project_dir: Path) -> tuple:
 
     Phase 1: Attempt merge with --no-commit to detect conflicts before
     finalising. This lets us inspect the merge result and abort cleanly
-    if conflicts are found, without leaving a broken merge commit.
+    if conflicts are found, without leaving a broken merge commit. An
+    in-memory git merge-tree precheck runs first, so most conflicting
+    branches are reported before the working tree is touched.
 
     Phase 2: If no conflicts, finalise with git commit. If conflicts
     are detected, abort and return rich conflict context for PM to
@@ -3773,6 +5095,25 @@ def merge_branch(branch_name: str, project_dir: Path) -> tuple:
 
     logger.info("Merging branch '%s' into main (two-phase)", branch_name)
 
+    # Precheck in memory first (git >= 2.38): a conflicting branch is
+    # reported without touching the working tree or needing an abort.
+    precheck = git_run(
+        ["merge-tree", "--write-tree", "--name-only", "--no-messages",
+         "HEAD", branch_name],
+        project_dir, check=False,
+    )
+    if precheck.returncode == 1:
+        conflict_context = _build_conflict_context(
+            branch_name,
+            project_dir,
+            "\n".join(precheck.stdout.splitlines()[1:]).strip() or "unknown",
+        )
+        logger.warning(
+            "Merge conflict for branch '%s': %s",
+            branch_name, conflict_context,
+        )
+        return (False, conflict_context)
+
     # Phase 1: Attempt merge with --no-commit to detect conflicts
     result = git_run(
         ["merge", "--no-commit", "--no-ff", branch_name],
@@ -3828,8 +5169,45 @@ def merge_branch(branch_name: str, project_dir: Path) -> tuple:
     return (True, "")
 
 
-def _build_conflict_context(
+def _resolve_conflict_commits(
     branch_name: str, project_dir: Path
+) -> Tuple[Optional[str], Optional[str]]:
+    """Return (HEAD sha, branch sha), reading refs in-process when possible."""
+    branches = load_branch_state(project_dir)
+    head_sha = _read_head_sha(project_dir, branches)
+    branch_sha = branches.get(branch_name)
+    if head_sha and branch_sha:
+        return head_sha, branch_sha
+
+    result = git_run(["rev-parse", "HEAD", branch_name], project_dir, check=False)
+    shas = result.stdout.split() if result.returncode == 0 else []
+    if len(shas) != 2:
+        return None, None
+    return shas[0], shas[1]
+
+
+@lru_cache(maxsize=512)
+def _merge_base_sha(project_dir: Path, first_sha: str, second_sha: str) -> Optional[str]:
+    """Return the merge-base of two commits (cached; callers sort the pair)."""
+    result = git_run(["merge-base", first_sha, second_sha], project_dir, check=False)
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+@lru_cache(maxsize=512)
+def _diff_stat(project_dir: Path, base_sha: str, target_sha: str) -> str:
+    """Return 'git diff --stat' between two commits, or "" on failure (cached)."""
+    result = git_run(["diff", "--stat", base_sha, target_sha], project_dir, check=False)
+    if result.returncode != 0 or not result.stdout:
+        return ""
+    return result.stdout.strip()
+
+
+def _build_conflict_context(
+    branch_name: str,
+    project_dir: Path,
+    conflicting_files: Optional[str] = None,
 ) -> str:
     """Build rich conflict context for PM to create a resolution sprint.
 
@@ -3841,43 +5219,37 @@ def _build_conflict_context(
     This context is passed to PM so it can create an informed
     conflict-resolution sprint without the orchestrator attempting
     to resolve conflicts itself.
+
+    conflicting_files may be supplied by a merge-tree precheck; otherwise
+    they are read from the index of the in-progress merge.
     """
-    # Get list of conflicting files
-    diff_result = git_run(
-        ["diff", "--name-only", "--diff-filter=U"],
-        project_dir, check=False,
-    )
-    conflicting_files = (
-        diff_result.stdout.strip() if diff_result.stdout else "unknown"
-    )
+    if conflicting_files is None:
+        diff_result = git_run(
+            ["diff", "--name-only", "--diff-filter=U"],
+            project_dir, check=False,
+        )
+        conflicting_files = (
+            diff_result.stdout.strip() if diff_result.stdout else "unknown"
+        )
 
     # Get what the sprint branch changed relative to merge-base
-    # (shows only the sprint's contributions, not main's changes)
-    merge_base = git_run(
-        ["merge-base", "HEAD", branch_name],
-        project_dir, check=False,
-    )
+    # (shows only the sprint's contributions, not main's changes). Refs are
+    # resolved to commit ids first so the merge-base and diff stats can be
+    # cached: they depend only on immutable commits.
     branch_changes = ""
     main_changes = ""
 
-    if merge_base.returncode == 0:
-        base_sha = merge_base.stdout.strip()
-
+    head_sha, branch_sha = _resolve_conflict_commits(branch_name, project_dir)
+    base_sha = (
+        _merge_base_sha(project_dir, *sorted((head_sha, branch_sha)))
+        if head_sha and branch_sha
+        else None
+    )
+    if base_sha:
         # Sprint branch changes since divergence
-        branch_diff = git_run(
-            ["diff", "--stat", base_sha, branch_name],
-            project_dir, check=False,
-        )
-        if branch_diff.returncode == 0 and branch_diff.stdout:
-            branch_changes = branch_diff.stdout.strip()
-
+        branch_changes = _diff_stat(project_dir, base_sha, branch_sha)
         # Main branch changes since divergence
-        main_diff = git_run(
-            ["diff", "--stat", base_sha, "HEAD"],
-            project_dir, check=False,
-        )
-        if main_diff.returncode == 0 and main_diff.stdout:
-            main_changes = main_diff.stdout.strip()
+        main_changes = _diff_stat(project_dir, base_sha, head_sha)
 
     parts = [
         f"Merge conflict in branch '{branch_name}'.",
@@ -3956,27 +5328,27 @@ def build_pm_context(
         if categorized["succeeded"]:
             parts.append("\nSUCCEEDED SPRINTS:")
             for pr in categorized["succeeded"]:
-                parts.append(_format_pl_result(pr))
+                parts.extend(_format_pl_result_lines(pr))
 
         # Failed sprints -- PM decides recovery strategy
         if categorized["failed"]:
             parts.append("\nFAILED SPRINTS (PM decides: retry, fix sprint, or mark blocked):")
             for pr in categorized["failed"]:
-                parts.append(_format_pl_result(pr))
+                parts.extend(_format_pl_result_lines(pr))
 
         # Unknown signal types -- PM should investigate
         if categorized["unknown"]:
             parts.append("\nUNKNOWN SIGNAL SPRINTS (unexpected signal type):")
             for pr in categorized["unknown"]:
-                parts.append(_format_pl_result(pr))
+                parts.extend(_format_pl_result_lines(pr))
 
         parts.append("--- END PL RESULTS ---")
 
     return "\n".join(parts)
 
 
-def _format_pl_result(pr: Dict[str, Any]) -> str:
-    """Format a single PL result for PM context.
+def _format_pl_result_lines(pr: Dict[str, Any]) -> List[str]:
+    """Return the PM context lines for a single PL result.
 
     Includes sprint name, signal type, summary/details, and merge
     status when available. Provides enough context for PM to make
@@ -4040,7 +5412,7 @@ def _format_pl_result(pr: Dict[str, Any]) -> str:
     if sig.get("merge_conflict"):
         lines.append(f"    Merge conflict: {sig['merge_conflict']}")
 
-    return "\n".join(lines)
+    return lines
 
 
 def build_pl_context(
@@ -4082,10 +5454,15 @@ def build_pl_context(
 # Sprint execution
 # ---------------------------------------------------------------------------
 
+_NODE_ID_INVALID_CHARS = re.compile(r"[^a-z0-9-]")
+_NODE_ID_DASH_RUNS = re.compile(r"-{2,}")
+
+
+@lru_cache(maxsize=1024)
 def _sanitize_graph_node_id(raw_name: str) -> str:
     """Convert a sprint name to a stable node identifier."""
-    node_id = re.sub(r"[^a-z0-9-]", "-", raw_name.lower())
-    node_id = re.sub(r"-{2,}", "-", node_id).strip("-")
+    node_id = _NODE_ID_INVALID_CHARS.sub("-", raw_name.lower())
+    node_id = _NODE_ID_DASH_RUNS.sub("-", node_id).strip("-")
     return node_id or "task"
 
 
@@ -4098,6 +5475,8 @@ def _sprints_to_graph(
     ordered_node_ids: List[str] = []
     parallel_flags: List[bool] = []
     used_ids: Set[str] = set()
+    # Next suffix to try per base id; every lower suffix is already taken.
+    next_suffix: Dict[str, int] = {}
 
     for idx, sprint in enumerate(sprints):
         if not isinstance(sprint, dict):
@@ -4107,10 +5486,13 @@ def _sprints_to_graph(
         sprint_name = str(sprint.get("name", "")).strip() or f"sprint-{idx + 1}"
         base_id = _sanitize_graph_node_id(sprint_name)
         node_id = base_id
-        suffix = 2
-        while node_id in used_ids:
+        if node_id in used_ids:
+            suffix = next_suffix.get(base_id, 2)
             node_id = f"{base_id}-{suffix}"
-            suffix += 1
+            while node_id in used_ids:
+                suffix += 1
+                node_id = f"{base_id}-{suffix}"
+            next_suffix[base_id] = suffix + 1
         used_ids.add(node_id)
 
         nodes[node_id] = GraphNode(
@@ -4182,68 +5564,6 @@ def _sprints_to_graph(
     return Graph(nodes=nodes, edges=edges, domain=domain)
 
 
-def execute_sprints(
-    sprints: List[Dict[str, Any]],
-    state: OrchestratorState,
-) -> List[Dict[str, Any]]:
-    """Compatibility wrapper around SoftwareHandler-based node execution."""
-    handler = SoftwareHandler()
-    config = ModelConfig(
-        provider="openai",
-        model="gpt-5.3-codex",
-        reasoning_effort="medium",
-        tool_profile="codex",
-        timeout=state.pl_timeout,
-        fallback=[],
-    )
-    results: List[Dict[str, Any]] = []
-
-    for sprint in sprints:
-        check_shutdown(state)
-        if not isinstance(sprint, dict):
-            logger.warning("Skipping non-dict sprint payload: %r", sprint)
-            continue
-
-        sprint_name = str(sprint.get("name", "")).strip() or "Unnamed sprint"
-        node_id = str(sprint.get("graph_node_id", "")).strip() or _sanitize_graph_node_id(sprint_name)
-        branch = str(sprint.get("branch", "")).strip() or f"sprint/{node_id}"
-        node = GraphNode(
-            id=node_id,
-            name=sprint_name,
-            type=NodeType.TASK,
-            node_class="implementation",
-            handler="software",
-            prd_path=_as_optional_str(sprint.get("prd")),
-            branch=branch,
-            inputs=sprint.get("inputs", {}) if isinstance(sprint.get("inputs"), dict) else {},
-            criteria=_as_string_list(sprint.get("criteria"), f"sprint '{sprint_name}' criteria"),
-        )
-        outcome = handler.execute(
-            node=node,
-            context="",
-            config=config,
-            project_dir=state.project_dir,
-            project_slug=state.project_slug,
-            cycle=state.cycle_count,
-        )
-        result = _node_outcome_to_result(node, outcome)
-        results.append(result)
-        logger.info(
-            "Sprint '%s' signal: %s",
-            sprint_name,
-            result.get("signal", {}).get("signal", "unknown"),
-        )
-        _capture_session_logs(
-            result.get("sprint", {}),
-            state.project_dir,
-            state.project_slug,
-            state.cycle_count,
-        )
-
-    checkout_main(state.project_dir)
-    return results
-
-
 # ---------------------------------------------------------------------------
 # Sprint result categorization
 # ---------------------------------------------------------------------------
@@ -4253,12 +5573,12 @@ def categorize_sprint_results(
 ) -> Dict[str, List[Dict[str, Any]]]:
     """Categorize sprint results into succeeded, failed, and unknown.
 
-    Used after execute_sprints() to give PM a clear picture of what
+    Used after graph node execution to give PM a clear picture of what
     happened. PM decides recovery strategy -- the orchestrator does NOT
     make recovery decisions itself.
 
     Args:
-        results: List of result dicts from execute_sprints(), each with
+        results: List of per-node result dicts, each with
                  'sprint' and 'signal' keys.
 
     Returns:
@@ -4272,14 +5592,13 @@ def categorize_sprint_results(
     failed: List[Dict[str, Any]] = []
     unknown: List[Dict[str, Any]] = []
 
+    buckets = {"done": succeeded, "error": failed, "blocked": failed}
+
     for result in results:
         sig_type = result.get("signal", {}).get("signal", "unknown")
-        if sig_type == "done":
-            succeeded.append(result)
-        elif sig_type in ("error", "blocked"):
-            failed.append(result)
-        else:
-            unknown.append(result)
+        # Non-string signal values (malformed agent YAML) cannot be dict keys.
+        bucket = buckets.get(sig_type, unknown) if isinstance(sig_type, str) else unknown
+        bucket.append(result)
 
     summary = (
         f"{len(succeeded)} succeeded, {len(failed)} failed"
@@ -4306,16 +5625,21 @@ def detect_stuck_loop(
 
     Returns the stuck sprint name if detected, None otherwise.
     """
-    combined = sprint_history + new_sprints
-    if len(combined) < STUCK_THRESHOLD:
+    if len(sprint_history) + len(new_sprints) < STUCK_THRESHOLD:
         return None
 
-    # Check if the last STUCK_THRESHOLD entries are all the same name
-    tail = combined[-STUCK_THRESHOLD:]
-    if len(set(tail)) == 1:
-        return tail[0]
+    # Check if the last STUCK_THRESHOLD entries are all the same name. Only
+    # that tail is sliced; the full history is never copied.
+    tail = new_sprints[-STUCK_THRESHOLD:]
+    missing = STUCK_THRESHOLD - len(tail)
+    if missing:
+        tail = sprint_history[-missing:] + tail
 
-    return None
+    first = tail[0]
+    for name in tail:
+        if name != first:
+            return None
+    return first
 
 
 # ---------------------------------------------------------------------------
@@ -4324,9 +5648,21 @@ def detect_stuck_loop(
 
 def _normalize_node_status(status: Any) -> str:
     """Normalize node status-like values into lowercase strings."""
+    if status.__class__ is str:
+        canonical = _CANONICAL_NODE_STATUSES.get(status)
+        if canonical is not None:
+            return canonical
+        return _normalize_status_text(status)
     if isinstance(status, NodeStatus):
         return status.value
-    return str(status).strip().lower()
+    return _normalize_status_text(str(status))
+
+
+@lru_cache(maxsize=64)
+def _normalize_status_text(status: str) -> str:
+    """Strip/lowercase a non-canonical status string (few distinct values)."""
+    normalized = status.strip().lower()
+    return _CANONICAL_NODE_STATUSES.get(normalized, normalized)
 
 
 def _status_map_for_ready_nodes(status_map: Dict[str, str]) -> Dict[str, str]:
@@ -4339,12 +5675,7 @@ def _status_map_for_ready_nodes(status_map: Dict[str, str]) -> Dict[str, str]:
 
 def _is_terminal_node_status(status: Any) -> bool:
     """Return True when status represents a finished node state."""
-    normalized = _normalize_node_status(status)
-    return normalized in (
-        NodeStatus.COMPLETED.value,
-        NodeStatus.FAILED.value,
-        NodeStatus.SKIPPED.value,
-    )
+    return _normalize_node_status(status) in _TERMINAL_NODE_STATUSES
 
 
 def _signal_to_display_status(signal: Dict[str, Any]) -> str:
@@ -4380,11 +5711,15 @@ def render_graph_status(graph: Graph, status_map: Dict[str, str]) -> str:
     children: Dict[str, List[str]] = {node_id: [] for node_id in graph.nodes}
     incoming_count: Dict[str, int] = {node_id: 0 for node_id in graph.nodes}
 
-    for edge in sorted(graph.edges, key=lambda item: (item.source, item.target)):
+    for edge in graph.edges:
         if edge.source not in graph.nodes or edge.target not in graph.nodes:
             continue
         children[edge.source].append(edge.target)
         incoming_count[edge.target] += 1
+    # Sort each child list once rather than the whole edge list plus every
+    # list again during traversal.
+    for child_ids in children.values():
+        child_ids.sort()
 
     roots = sorted(
         [node_id for node_id, count in incoming_count.items() if count == 0]
@@ -4395,23 +5730,28 @@ def render_graph_status(graph: Graph, status_map: Dict[str, str]) -> str:
     lines = ["Pipeline Status:"]
     rendered_nodes: Set[str] = set()
     rendered_edges: Set[Tuple[str, str]] = set()
+    node_lines: Dict[str, str] = {}
 
     def node_line(node_id: str) -> str:
-        node = graph.nodes[node_id]
-        label = _node_status_label(
-            status_map.get(node_id, NodeStatus.PENDING.value)
-        )
-        display_name = node.name or node_id
-        return f"[{label}] {display_name}"
+        text = node_lines.get(node_id)
+        if text is None:
+            node = graph.nodes[node_id]
+            label = _node_status_label(
+                status_map.get(node_id, NodeStatus.PENDING.value)
+            )
+            display_name = node.name or node_id
+            text = node_lines[node_id] = f"[{label}] {display_name}"
+        return text
 
     for root_id in roots:
         lines.append(f"  {node_line(root_id)}")
         rendered_nodes.add(root_id)
-        queue: deque[Tuple[str, str]] = deque([(root_id, "    ")])
+        queue: deque[Tuple[str, int]] = deque([(root_id, 1)])
 
         while queue:
-            parent_id, indent = queue.popleft()
-            for child_id in sorted(children.get(parent_id, [])):
+            parent_id, depth = queue.popleft()
+            indent = "    " * depth
+            for child_id in children[parent_id]:
                 edge_key = (parent_id, child_id)
                 if edge_key in rendered_edges:
                     continue
@@ -4421,7 +5761,7 @@ def render_graph_status(graph: Graph, status_map: Dict[str, str]) -> str:
                 if child_id in rendered_nodes:
                     continue
                 rendered_nodes.add(child_id)
-                queue.append((child_id, indent + "    "))
+                queue.append((child_id, depth + 1))
 
     for node_id in sorted(graph.nodes):
         if node_id in rendered_nodes:
@@ -4461,18 +5801,7 @@ def _describe_blocked_nodes(
 
 def _collect_downstream_nodes(graph_engine: GraphEngine, start_node_id: str) -> List[str]:
     """Return all transitive downstream node IDs from the starting node."""
-    queue: deque[str] = deque([start_node_id])
-    seen: Set[str] = set()
-
-    while queue:
-        current = queue.popleft()
-        for downstream_id in graph_engine.get_downstream_nodes(current):
-            if downstream_id in seen:
-                continue
-            seen.add(downstream_id)
-            queue.append(downstream_id)
-
-    return sorted(seen)
+    return sorted(graph_engine.get_downstream_closure(start_node_id))
 
 
 def _resolve_discovery_context_artifact(
@@ -4524,22 +5853,7 @@ def _collect_upstream_execution_path(
     node_id: str,
 ) -> List[str]:
     """Collect all transitive upstream node IDs for a node."""
-    queue: deque[str] = deque(sorted(graph_engine.get_upstream_nodes(node_id)))
-    seen: Set[str] = set()
-    ordered: List[str] = []
-
-    while queue:
-        current = queue.popleft()
-        if current in seen:
-            continue
-        seen.add(current)
-        ordered.append(current)
-
-        for upstream_id in sorted(graph_engine.get_upstream_nodes(current)):
-            if upstream_id not in seen:
-                queue.append(upstream_id)
-
-    return ordered
+    return list(graph_engine.get_upstream_path(node_id))
 
 
 def estimate_token_count(text: str) -> int:
@@ -4547,6 +5861,33 @@ def estimate_token_count(text: str) -> int:
     return max(0, len(text) // 4)
 
 
+def _build_project_context_lines(project_dir: Path, project_slug: str) -> List[str]:
+    """Return the PROJECT_CONTEXT lines shared by every node in a project."""
+    outcomes_path = _project_tasks_dir(project_dir, project_slug) / "OUTCOMES.md"
+    outcomes_summary = "Unavailable"
+    if outcomes_path.is_file():
+        try:
+            outcomes_text = _read_cached(outcomes_path).strip()
+        except OSError as exc:
+            logger.warning("Failed to read OUTCOMES.md for node context: %s", exc)
+        else:
+            if outcomes_text:
+                outcomes_summary = outcomes_text[:500]
+
+    lines = [f"OUTCOMES_SUMMARY: {outcomes_summary}", "MEMORY_SYSTEM_PATHS:"]
+    for path_text in (
+        ".ai/ARCHITECTURE.json",
+        ".ai/FILES.json",
+        ".ai/PATTERNS.md",
+        ".ai/QUICK.md",
+        ".ai/BUSINESS.json",
+    ):
+        exists = (project_dir / path_text).is_file()
+        suffix = "" if exists else " (missing)"
+        lines.append(f"- {path_text}{suffix}")
+    return lines
+
+
 def build_node_context(
     node: GraphNode,
     graph: Graph,
@@ -4554,9 +5895,18 @@ def build_node_context(
     project_dir: Path,
     project_slug: str = "",
     fidelity: ContextFidelityMode = ContextFidelityMode.MINIMAL,
+    graph_engine: Optional[GraphEngine] = None,
+    project_context: Optional[Dict[Tuple[str, str], List[str]]] = None,
 ) -> str:
-    """Build node context with minimal, partial, and full fidelity modes."""
-    graph_engine = GraphEngine(graph)
+    """Build node context with minimal, partial, and full fidelity modes.
+
+    Pass the run's existing graph_engine to avoid rebuilding its indexes
+    for every node; one is built from graph when omitted. Nodes built in
+    the same wave can share a project_context dict so OUTCOMES.md and the
+    .ai memory paths are only checked once.
+    """
+    if graph_engine is None or graph_engine.graph is not graph:
+        graph_engine = GraphEngine(graph)
     fidelity_mode = _coerce_enum(
         ContextFidelityMode,
         fidelity,
@@ -4579,37 +5929,19 @@ def build_node_context(
         "source_materials": list(node.source_materials),
     }
 
-    outcomes_path = _project_tasks_dir(project_dir, project_slug) / "OUTCOMES.md"
-    outcomes_summary = "Unavailable"
-    if outcomes_path.is_file():
-        try:
-            outcomes_text = outcomes_path.read_text(encoding="utf-8").strip()
-        except OSError as exc:
-            logger.warning("Failed to read OUTCOMES.md for node context: %s", exc)
-        else:
-            if outcomes_text:
-                outcomes_summary = outcomes_text[:500]
-
-    memory_paths: List[str] = []
-    for path_text in (
-        ".ai/ARCHITECTURE.json",
-        ".ai/FILES.json",
-        ".ai/PATTERNS.md",
-        ".ai/QUICK.md",
-        ".ai/BUSINESS.json",
-    ):
-        exists = (project_dir / path_text).is_file()
-        suffix = "" if exists else " (missing)"
-        memory_paths.append(f"- {path_text}{suffix}")
+    cache_key = (str(project_dir), project_slug)
+    project_lines = project_context.get(cache_key) if project_context is not None else None
+    if project_lines is None:
+        project_lines = _build_project_context_lines(project_dir, project_slug)
+        if project_context is not None:
+            project_context[cache_key] = project_lines
 
     lines = [
         f"NODE_CONTEXT_FIDELITY: {fidelity_mode.value}",
         "NODE_PARAMETERS:",
-        json.dumps(node_payload, indent=2, sort_keys=True, ensure_ascii=True),
+        _PROMPT_JSON_ENCODER.encode(node_payload),
         "PROJECT_CONTEXT:",
-        f"OUTCOMES_SUMMARY: {outcomes_summary}",
-        "MEMORY_SYSTEM_PATHS:",
-    ] + memory_paths
+    ] + project_lines
 
     direct_upstream_nodes = sorted(graph_engine.get_upstream_nodes(node.id))
     if fidelity_mode in (ContextFidelityMode.PARTIAL, ContextFidelityMode.FULL):
@@ -4642,7 +5974,8 @@ def build_node_context(
 
             relative_path, absolute_path = resolved
             try:
-                context_text = absolute_path.read_text(encoding="utf-8").strip()
+                # Every downstream node shares the one cached copy.
+                context_text = _read_cached(absolute_path).strip()
             except OSError as exc:
                 logger.warning(
                     "Failed to read CONTEXT.md for discovery node '%s': %s",
@@ -4714,6 +6047,8 @@ def build_node_context(
             project_dir=project_dir,
             project_slug=project_slug,
             fidelity=ContextFidelityMode.PARTIAL,
+            graph_engine=graph_engine,
+            project_context=project_context,
         )
 
     logger.info(
@@ -4731,6 +6066,7 @@ def _build_node_context(
     checkpoint_manager: "CheckpointManager",
     project_dir: Path,
     project_slug: str = "",
+    project_context: Optional[Dict[Tuple[str, str], List[str]]] = None,
 ) -> str:
     """Backward-compatible wrapper around public build_node_context()."""
     return build_node_context(
@@ -4745,6 +6081,8 @@ def _build_node_context(
             ContextFidelityMode.MINIMAL,
             f"graph node '{node.id}' context_fidelity",
         ),
+        graph_engine=graph_engine,
+        project_context=project_context,
     )
 
 
@@ -4843,11 +6181,7 @@ def _find_resumable_run_dir(tasks_dir: Path, graph_hash: str) -> Optional[Path]:
                         node_statuses.append(NodeStatus.PENDING.value)
 
             if node_statuses and all(
-                status in (
-                    NodeStatus.COMPLETED.value,
-                    NodeStatus.FAILED.value,
-                    NodeStatus.SKIPPED.value,
-                )
+                status in _TERMINAL_NODE_STATUSES
                 for status in node_statuses
             ):
                 saw_terminal_match = True
@@ -4880,9 +6214,79 @@ def _find_latest_run_dir(tasks_dir: Path) -> Optional[Path]:
     return None
 
 
-def _load_graph_from_yaml_file(graph_path: Path) -> Graph:
-    """Load a graph definition file (raw graph YAML or next_graph signal YAML)."""
-    text = graph_path.read_text(encoding="utf-8")
+def _graph_cache_path(cache_dir: Path, raw: bytes) -> Tuple[str, Path]:
+    """Return the content hash and cache file path for a graph definition."""
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return digest, cache_dir / f"graph-{digest}.json"
+
+
+def _read_graph_cache(cache_path: Path, digest: str) -> Optional[Graph]:
+    """Return the cached parsed graph for digest, or None on miss/corruption."""
+    try:
+        wrapper = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(wrapper, dict) or wrapper.get("graph_hash") != digest:
+        return None
+    payload = wrapper.get("graph")
+    if not isinstance(payload, dict):
+        return None
+    try:
+        return _parse_graph_signal(payload)
+    except Exception as exc:
+        logger.debug("Ignoring unusable graph cache '%s': %s", cache_path, exc)
+        return None
+
+
+def _write_graph_cache(cache_path: Path, digest: str, graph: Graph) -> None:
+    """Persist a parsed graph as JSON, preserving node and edge order."""
+    payload = _graph_to_payload(graph)
+    nodes_by_id = {node["id"]: node for node in payload["nodes"]}
+    payload["nodes"] = [nodes_by_id[node.id] for node in graph.nodes.values()]
+    payload["edges"] = [
+        {
+            "source": edge.source,
+            "target": edge.target,
+            "condition": edge.condition or "always",
+        }
+        for edge in graph.edges
+    ]
+    data = json.dumps(
+        {"graph_hash": digest, "graph": payload},
+        separators=(",", ":"),
+    ).encode("utf-8")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write_bytes(cache_path, data)
+    except OSError as exc:
+        logger.debug("Failed to write graph cache '%s': %s", cache_path, exc)
+
+
+def _load_graph_from_yaml_file(
+    graph_path: Path,
+    cache_dir: Optional[Path] = None,
+) -> Graph:
+    """Load a graph definition file (raw graph YAML or next_graph signal YAML).
+
+    When cache_dir is given, parsed graphs are cached there as JSON keyed by
+    a hash of the file contents, so unchanged files skip the YAML parse.
+    """
+    if cache_dir is None:
+        return _parse_graph_definition(graph_path.read_text(encoding="utf-8"))
+
+    raw = graph_path.read_bytes()
+    digest, cache_path = _graph_cache_path(cache_dir, raw)
+    cached = _read_graph_cache(cache_path, digest)
+    if cached is not None:
+        return cached
+
+    graph = _parse_graph_definition(raw.decode("utf-8"))
+    _write_graph_cache(cache_path, digest, graph)
+    return graph
+
+
+def _parse_graph_definition(text: str) -> Graph:
+    """Parse graph definition text (raw graph YAML or next_graph signal YAML)."""
 
     if SIGNAL_MARKER in text:
         parsed_signal = parse_signal(text)
@@ -4961,22 +6365,130 @@ def _build_gate_upstream_outcomes(
     return upstream_outcomes
 
 
+def _execute_node(
+    node: GraphNode,
+    handler: NodeHandler,
+    node_context: str,
+    model_config: ModelConfig,
+    state: OrchestratorState,
+) -> NodeOutcome:
+    """Run one node's handler, turning an escaped exception into a failure.
+
+    Handlers report agent failures as outcomes, but git helpers called after
+    the agent finishes can still raise. Without this, one raising worker
+    would abandon its wave and every sibling outcome with it.
+    """
+    started_at = time.monotonic()
+    try:
+        return handler.execute(
+            node=node,
+            context=node_context,
+            config=model_config,
+            project_dir=state.project_dir,
+            project_slug=state.project_slug,
+            cycle=state.cycle_count,
+        )
+    except Exception as exc:
+        logger.exception("Graph node '%s' raised during execution: %s", node.id, exc)
+        details = f"{exc.__class__.__name__}: {exc}"
+        return NodeOutcome(
+            status=NodeStatus.FAILED.value,
+            output_summary=f"Node '{node.id}' raised {details}",
+            duration=time.monotonic() - started_at,
+            model_used=f"{model_config.provider}:{model_config.model}",
+            error_details=details,
+        )
+
+
+def _dispatch_ready_nodes(
+    dispatches: List[Tuple[GraphNode, NodeHandler, str, ModelConfig]],
+    state: OrchestratorState,
+) -> Iterator[Tuple[GraphNode, NodeOutcome]]:
+    """Execute independent ready nodes concurrently, yielding as each finishes.
+
+    Every dispatched node has all of its dependencies satisfied, so nodes in
+    the same ready frontier never consume each other's output. Only nodes
+    whose handler runs_isolated go to the pool; the rest write into the
+    shared checkout, so they run one at a time before the pool starts and
+    never overlap a merge. Launches are staggered by PARALLEL_LAUNCH_DELAY
+    to avoid a burst of agent start-ups.
+
+    A shutdown request stops further launches, but nodes already running
+    are still drained and yielded so their outcomes can be recorded; the
+    caller acts on the shutdown once the generator is exhausted.
+    """
+    shared = [dispatch for dispatch in dispatches if not dispatch[1].runs_isolated]
+    isolated = [dispatch for dispatch in dispatches if dispatch[1].runs_isolated]
+
+    for index, (node, handler, node_context, model_config) in enumerate(shared):
+        if _shutdown_event.is_set():
+            logger.info(
+                "Graceful shutdown: not launching %d queued node(s)",
+                len(dispatches) - index,
+            )
+            return
+        yield node, _execute_node(node, handler, node_context, model_config, state)
+
+    if not isolated:
+        return
+
+    max_workers = max(1, min(int(state.max_parallel or 1), len(isolated)))
+    with ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="graph-node",
+    ) as executor:
+        futures = {}
+        for index, (node, handler, node_context, model_config) in enumerate(isolated):
+            if 0 < index < max_workers:
+                # Returns early if a shutdown is requested during the stagger.
+                _shutdown_event.wait(PARALLEL_LAUNCH_DELAY)
+            if _shutdown_event.is_set():
+                logger.info(
+                    "Graceful shutdown: not launching %d queued node(s); "
+                    "waiting for %d running node(s)",
+                    len(isolated) - index,
+                    len(futures),
+                )
+                break
+            future = executor.submit(
+                _execute_node, node, handler, node_context, model_config, state
+            )
+            futures[future] = node
+
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
 # ---------------------------------------------------------------------------
 # 7.4 -- Main PM-PL orchestration cycle loop
 # ---------------------------------------------------------------------------
 
 def run_orchestration(state: OrchestratorState) -> int:
     """Main orchestration loop. Returns exit code (0=success, 1=error)."""
+    handler_registry: Dict[str, NodeHandler] = {
+        DomainType.SOFTWARE.value: SoftwareHandler(worktree_pool_size=state.max_parallel),
+        DomainType.CONTENT.value: ContentHandler(),
+        NodeType.DISCOVERY.value: DiscoveryHandler(),
+    }
+    try:
+        return _run_orchestration_cycles(state, handler_registry)
+    finally:
+        for handler in handler_registry.values():
+            handler.close()
+        if state.checkpoint_manager is not None:
+            state.checkpoint_manager.close()
+
+
+def _run_orchestration_cycles(
+    state: OrchestratorState,
+    handler_registry: Dict[str, NodeHandler],
+) -> int:
+    """Run PM/graph cycles until completion, failure or max cycles."""
     pm_error_retries = 0
     sprint_history: List[str] = []
     pl_results: Optional[List[Dict[str, Any]]] = None
     roadmap_content = read_roadmap(state)
     stylesheet_loader = StylesheetLoader(str(state.project_dir / "model-stylesheet.yaml"))
-    handler_registry: Dict[str, NodeHandler] = {
-        DomainType.SOFTWARE.value: SoftwareHandler(),
-        DomainType.CONTENT.value: ContentHandler(),
-        NodeType.DISCOVERY.value: DiscoveryHandler(),
-    }
 
     while state.cycle_count < state.max_cycles:
         check_shutdown(state)
@@ -5115,7 +6627,7 @@ def run_orchestration(state: OrchestratorState) -> int:
                 )
             else:
                 try:
-                    outcomes_content = state.outcomes_path.read_text(encoding="utf-8")
+                    outcomes_content = _read_cached(state.outcomes_path)
                 except OSError as exc:
                     logger.warning(
                         "Failed to read OUTCOMES.md for domain detection: %s. "
@@ -5203,7 +6715,13 @@ def run_orchestration(state: OrchestratorState) -> int:
                 run_dir.mkdir(parents=True, exist_ok=True)
                 logger.info("Starting new graph run '%s' at %s", run_id, run_dir)
 
-            checkpoint_manager = CheckpointManager(str(run_dir), graph)
+            if state.checkpoint_manager is not None:
+                state.checkpoint_manager.close()
+            checkpoint_manager = CheckpointManager(
+                str(run_dir),
+                graph,
+                fsync_mode=state.checkpoint_fsync,
+            )
             state.current_graph = graph
             state.checkpoint_manager = checkpoint_manager
             state.run_id = checkpoint_manager.run_id or run_id
@@ -5217,6 +6735,10 @@ def run_orchestration(state: OrchestratorState) -> int:
                 "%s",
                 render_graph_status(graph, checkpoint_manager.get_status_map()),
             )
+            graph_engine.seed_ready_frontier(
+                _status_map_for_ready_nodes(checkpoint_manager.get_status_map()),
+                outcome_map=node_outcomes,
+            )
 
             # Graph traversal loop.
             while True:
@@ -5227,9 +6749,8 @@ def run_orchestration(state: OrchestratorState) -> int:
                     return 1
 
                 status_map = checkpoint_manager.get_status_map()
-                ready_nodes = graph_engine.get_ready_nodes(
-                    _status_map_for_ready_nodes(status_map),
-                    outcome_map=node_outcomes,
+                ready_nodes = graph_engine.drain_ready_nodes(
+                    _status_map_for_ready_nodes(status_map)
                 )
                 all_nodes_complete = all(
                     _is_terminal_node_status(
@@ -5255,7 +6776,17 @@ def run_orchestration(state: OrchestratorState) -> int:
                     print(f"Blocked nodes: {blocked_details}")
                     return 1
 
-                for node_id in ready_nodes:
+                # Gates are cheap local checks and may reroute the graph, so
+                # they run first and inline; work nodes are then dispatched
+                # together across the worker pool.
+                dispatches: List[Tuple[GraphNode, NodeHandler, str, ModelConfig]] = []
+                # OUTCOMES.md and .ai paths cannot change until this wave runs.
+                project_context: Dict[Tuple[str, str], List[str]] = {}
+                frontier_reset = False
+                for node_id in sorted(
+                    ready_nodes,
+                    key=lambda ready_id: graph.nodes[ready_id].type != NodeType.GATE,
+                ):
                     check_shutdown(state)
 
                     node = graph.nodes[node_id]
@@ -5296,6 +6827,13 @@ def run_orchestration(state: OrchestratorState) -> int:
                                         "Gate retry invalidated nodes: %s",
                                         ", ".join(invalidated_nodes),
                                     )
+                                graph_engine.seed_ready_frontier(
+                                    _status_map_for_ready_nodes(
+                                        checkpoint_manager.get_status_map()
+                                    ),
+                                    outcome_map=node_outcomes,
+                                )
+                                frontier_reset = True
                                 logger.info(
                                     "%s",
                                     render_graph_status(graph, checkpoint_manager.get_status_map()),
@@ -5324,6 +6862,7 @@ def run_orchestration(state: OrchestratorState) -> int:
                             print(failure_context)
                             return 1
 
+                        graph_engine.on_node_completed(node_id, outcome)
                         for edge in graph_engine.forward_edges.get(node_id, []):
                             condition_active = graph_engine.evaluate_edge_condition(edge, outcome)
                             logger.info(
@@ -5345,6 +6884,11 @@ def run_orchestration(state: OrchestratorState) -> int:
                         )
                         continue
 
+                    if frontier_reset:
+                        # The reseeded frontier re-queues this node if it is
+                        # still ready after the gate retry invalidation.
+                        continue
+
                     model_config = stylesheet_loader.select(node.node_class)
                     model_hint = f"{model_config.provider}:{model_config.model}"
                     checkpoint_manager.record_node_start(node_id, model_hint)
@@ -5366,6 +6910,7 @@ def run_orchestration(state: OrchestratorState) -> int:
                         checkpoint_manager,
                         state.project_dir,
                         state.project_slug,
+                        project_context,
                     )
                     logger.info(
                         "Executing graph node '%s' (%s via %s)",
@@ -5373,19 +6918,15 @@ def run_orchestration(state: OrchestratorState) -> int:
                         handler_key or DomainType.SOFTWARE.value,
                         model_hint,
                     )
+                    dispatches.append((node, handler, node_context, model_config))
 
-                    outcome = handler.execute(
-                        node=node,
-                        context=node_context,
-                        config=model_config,
-                        project_dir=state.project_dir,
-                        project_slug=state.project_slug,
-                        cycle=state.cycle_count,
-                    )
+                for node, outcome in _dispatch_ready_nodes(dispatches, state):
+                    node_id = node.id
                     result = _node_outcome_to_result(node, outcome)
                     node_results[node.id] = result
                     node_outcomes[node.id] = outcome
                     checkpoint_manager.record_node_completion(node_id, outcome)
+                    graph_engine.on_node_completed(node_id, outcome)
 
                     if (
                         node.type == NodeType.DISCOVERY
@@ -5466,6 +7007,10 @@ def run_orchestration(state: OrchestratorState) -> int:
                     display_map[node_id] = _normalize_node_status(outcome.status)
                     logger.info("%s", render_graph_status(graph, display_map))
 
+                # Wave barrier: persist every completion in this batch.
+                checkpoint_manager.flush()
+                check_shutdown(state)
+
             pl_results = list(node_results.values())
 
             # Categorize results for logging and PM context.
@@ -5593,7 +7138,10 @@ def _run_graph_validation_mode(project_dir: Path, graph_file: Path) -> int:
         return 1
 
     try:
-        graph = _load_graph_from_yaml_file(candidate)
+        graph = _load_graph_from_yaml_file(
+            candidate,
+            cache_dir=project_dir / "tasks" / ".cache",
+        )
     except Exception as exc:
         print(f"Graph validation failed: unable to parse '{candidate}': {exc}", file=sys.stderr)
         return 1
@@ -5642,6 +7190,7 @@ def _run_invalidate_nodes_mode(tasks_dir: Path, node_ids_csv: str) -> int:
 
     checkpoint_manager = CheckpointManager(str(latest_run), graph)
     invalidated = checkpoint_manager.invalidate_nodes(requested_node_ids)
+    checkpoint_manager.close()
 
     if not invalidated:
         print(
@@ -5757,6 +7306,24 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=DEFAULT_PL_TIMEOUT,
         help=f"PL agent timeout in seconds (default: {DEFAULT_PL_TIMEOUT})",
     )
+    parser.add_argument(
+        "--max-parallel",
+        type=int,
+        default=DEFAULT_MAX_PARALLEL,
+        help=(
+            "Maximum independent graph nodes executed concurrently "
+            f"(default: {DEFAULT_MAX_PARALLEL})"
+        ),
+    )
+    parser.add_argument(
+        "--checkpoint-fsync",
+        choices=list(CHECKPOINT_FSYNC_MODES),
+        default=DEFAULT_CHECKPOINT_FSYNC,
+        help=(
+            "Checkpoint durability: 'always' fsyncs every write, 'deferred' "
+            f"fsyncs only at wave barriers and shutdown (default: {DEFAULT_CHECKPOINT_FSYNC})"
+        ),
+    )
     parser.add_argument(
         "--log-level",
         default=DEFAULT_LOG_LEVEL,
@@ -5865,6 +7432,8 @@ def main(argv: Optional[List[str]] = None) -> int:
         max_cycles=args.max_cycles,
         pm_timeout=args.pm_timeout,
         pl_timeout=args.pl_timeout,
+        max_parallel=max(1, args.max_parallel),
+        checkpoint_fsync=args.checkpoint_fsync,
     )
 
     # Setup logging
@@ -5872,12 +7441,15 @@ def main(argv: Optional[List[str]] = None) -> int:
     if auto_detected_project:
         logger.info("Auto-detected project: %s", state.project_slug)
     logger.info(
-        "Orchestrator starting: project=%s, slug=%s, max_cycles=%d, pm_timeout=%d, pl_timeout=%d",
+        "Orchestrator starting: project=%s, slug=%s, max_cycles=%d, pm_timeout=%d, "
+        "pl_timeout=%d, max_parallel=%d, checkpoint_fsync=%s",
         project_dir,
         state.project_slug,
         state.max_cycles,
         state.pm_timeout,
         state.pl_timeout,
+        state.max_parallel,
+        state.checkpoint_fsync,
     )
 
     if args.invalidate_nodes:
@@ -5923,6 +7495,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     except Exception as exc:
         logger.exception("Unhandled exception in orchestration loop: %s", exc)
         exit_code = 1
+    flush_agent_logs()
 
     # --- Archive on successful completion ---
     if exit_code == 0: